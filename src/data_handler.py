@@ -2,10 +2,16 @@
 Data handler for loading and saving user data to JSON.
 """
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import UserData, DEFAULT_PLANT_ID
 
 
@@ -13,6 +19,12 @@ from .models import UserData, DEFAULT_PLANT_ID
 DATA_DIR = Path(__file__).parent.parent / "data"
 DATA_FILE = DATA_DIR / "user_data.json"
 
+# Bump when the saved format changes; files at this version skip the migration ladder
+CURRENT_SCHEMA_VERSION = 2
+
+# UserData.state_key() of the last write; saves with an identical snapshot are skipped
+_last_saved_state: Optional[tuple] = None
+
 
 def ensure_data_dir() -> None:
     """Create data directory if it doesn't exist."""
@@ -20,31 +32,52 @@ def ensure_data_dir() -> None:
 
 
 def get_default_data() -> Dict[str, Any]:
-    """Return default user data structure."""
+    """Return default user data structure (last_login left empty; see _fresh_defaults_with_timestamp)."""
     return {
         "currency_balance": 0,
         "active_plant_id": DEFAULT_PLANT_ID,
         "plant_stages": {DEFAULT_PLANT_ID: 0},
         "pet_custom_names": {},
         "inventory": [],
-        "last_login": datetime.now().strftime("%Y-%m-%d")
+        "last_login": ""
     }
 
 
+def _fresh_defaults_with_timestamp() -> Dict[str, Any]:
+    """Default user data with last_login set to today, for brand-new or unreadable files."""
+    data = get_default_data()
+    data["last_login"] = datetime.now().strftime("%Y-%m-%d")
+    return data
+
+
 def load_user_data() -> UserData:
     """Load user data from JSON file, or return default if file doesn't exist."""
+    global _last_saved_state
+    _last_saved_state = None
     ensure_data_dir()
     
     if not DATA_FILE.exists():
-        default_data = get_default_data()
-        save_user_data_dict(default_data)
+        default_data = _fresh_defaults_with_timestamp()
+        save_user_data_dict({**default_data, "schema_version": CURRENT_SCHEMA_VERSION})
         return UserData(**default_data)
     
     try:
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(DATA_FILE.read_bytes())
+        else:
+            with open(DATA_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        if not isinstance(data, dict):
+            raise TypeError(f"expected a JSON object, got {type(data).__name__}")
         
-        default_data = get_default_data()
+        if data.pop("schema_version", None) == CURRENT_SCHEMA_VERSION:
+            default_data = get_default_data()
+            for key in default_data.keys():
+                if key not in data:
+                    data[key] = default_data[key]
+            return UserData(**data)
+
+        default_data = _fresh_defaults_with_timestamp()
         if "pet_custom_names" not in data:
             data["pet_custom_names"] = data.get("plant_custom_names", {})
         if "plant_custom_names" in data:
@@ -66,16 +99,27 @@ def load_user_data() -> UserData:
             if key not in data:
                 data[key] = default_data[key]
         
-        return UserData(**data)
+        user_data = UserData(**data)
+        try:
+            save_user_data(user_data)  # stamp the current schema version
+        except OSError as e:
+            # Read-only or locked data file: keep the migrated data; the next successful save stamps it
+            print(f"Could not save migrated user data: {e}")
+        return user_data
     except (json.JSONDecodeError, KeyError, TypeError) as e:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so both parsers land here
         # If file is corrupted, return default
         print(f"Error loading user data: {e}. Using default data.")
-        default_data = get_default_data()
+        default_data = _fresh_defaults_with_timestamp()
         return UserData(**default_data)
 
 
 def save_user_data(user_data: UserData) -> None:
-    """Save user data to JSON file."""
+    """Save user data to JSON file. No-op if nothing changed since the last save."""
+    global _last_saved_state
+    state = user_data.state_key()
+    if state == _last_saved_state:
+        return
     ensure_data_dir()
     
     data_dict = {
@@ -84,15 +128,25 @@ def save_user_data(user_data: UserData) -> None:
         "plant_stages": user_data.plant_stages,
         "pet_custom_names": user_data.pet_custom_names,
         "inventory": user_data.inventory,
-        "last_login": user_data.last_login
+        "last_login": user_data.last_login,
+        "schema_version": CURRENT_SCHEMA_VERSION,
     }
     
     save_user_data_dict(data_dict)
+    _last_saved_state = state
 
 
 def save_user_data_dict(data: Dict[str, Any]) -> None:
-    """Save data dictionary to JSON file."""
+    """Save data dictionary to JSON file (written to a temp file, then swapped in atomically)."""
     ensure_data_dir()
     
-    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp_file = DATA_FILE.with_suffix(".json.tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, DATA_FILE)
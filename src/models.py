@@ -22,7 +22,7 @@ TASKS: List[Tuple[str, str, int]] = [
 DEFAULT_PLANT_ID = "plant_shrub"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserData:
     """User data structure for persistence."""
     currency_balance: int = 0
@@ -31,9 +31,24 @@ class UserData:
     pet_custom_names: Dict[str, str] = field(default_factory=dict)  # pet_id -> custom display name
     inventory: List[str] = field(default_factory=list)
     last_login: str = ""  # ISO date string (YYYY-MM-DD)
-
-
-@dataclass
+    # (inventory length, plant ids, pet ids) derived by shop_manager; not persisted
+    _owned_cache: Optional[Tuple[int, List[str], List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def state_key(self) -> tuple:
+        """Immutable snapshot of the persisted fields, for detecting unchanged saves."""
+        return (
+            self.currency_balance,
+            self.active_plant_id,
+            tuple(sorted(self.plant_stages.items())),
+            tuple(sorted(self.pet_custom_names.items())),
+            tuple(self.inventory),
+            self.last_login,
+        )
+
+
+@dataclass(slots=True)
 class ShopItem:
     """Shop item structure. If upgrade_stage is set, buying it sets plant_stage (no inventory)."""
     id: str
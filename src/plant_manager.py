@@ -1,8 +1,11 @@
 """
 Plant growth stage logic based on currency milestones.
 """
+from bisect import bisect_right
+
 # Dewdrop milestones for each stage (inclusive lower bound)
 # Stages 0-5: 0, 100, 200, 300, 400, 500+
+# Kept as a tuple: bisect over array.array has to box every probed element and measures slower.
 MILESTONES = (0, 100, 200, 300, 400, 500)
 
 
@@ -11,8 +14,5 @@ def get_stage_from_currency(balance: int) -> int:
     Return plant stage (0-5) for a given dewdrop balance.
     Milestones: 0, 100, 200, 300, 400, 500.
     """
-    stage = 0
-    for i, milestone in enumerate(MILESTONES):
-        if balance >= milestone:
-            stage = i
-    return min(stage, 5)
+    # bisect_right never exceeds len(MILESTONES), so the result is already capped at the top stage
+    return max(0, bisect_right(MILESTONES, balance) - 1)
@@ -1,12 +1,19 @@
 """
 Shop: plants and pets. Stage upgrades live in a separate Grow UI.
 """
-from typing import List, Optional
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Optional, Tuple
 
 from .models import ShopItem, UserData, DEFAULT_PLANT_ID
 from .utils.image_loader import get_max_stage
 
 
+# Inventory id prefixes (plant ids keep theirs; pet ids are stored without it)
+PLANT_PREFIX = "plant_"
+PET_PREFIX = "pet_"
+_PLANT_PREFIX_LEN = len(PLANT_PREFIX)
+_PET_PREFIX_LEN = len(PET_PREFIX)
+
 # Plants (names match folder: baby_cactus -> Baby Cactus)
 SHOP_ITEMS: List[ShopItem] = [
     ShopItem(id="plant_baby_cactus", name="Baby Cactus", cost=100, description=""),
@@ -24,6 +31,9 @@ SHOP_PET_ITEMS: List[ShopItem] = [
     ShopItem(id="pet_slime", name="Slime", cost=1000, description=""),
 ]
 
+# id -> item for O(1) lookups (plants and pets)
+_ITEM_BY_ID: Dict[str, ShopItem] = {item.id: item for item in SHOP_ITEMS + SHOP_PET_ITEMS}
+
 
 def get_shop_items() -> List[ShopItem]:
     """Return all shop items (plants and pets). For sectioned UI use get_shop_plant_items / get_shop_pet_items."""
@@ -42,56 +52,71 @@ def get_shop_pet_items() -> List[ShopItem]:
 
 def get_item(item_id: str) -> Optional[ShopItem]:
     """Return the shop item with the given id (plant or pet), or None."""
-    for item in SHOP_PET_ITEMS + SHOP_ITEMS:
-        if item.id == item_id:
-            return item
-    return None
+    return _ITEM_BY_ID.get(item_id)
 
 
-def get_stage_upgrade_items(plant_id: str) -> List[ShopItem]:
-    """Return stage upgrade items for this plant (stages 1 through max_stage for its folder)."""
+@lru_cache(maxsize=None)
+def get_stage_upgrade_items(plant_id: str) -> Tuple[ShopItem, ...]:
+    """Return stage upgrade items for this plant (stages 1 through max_stage for its folder). Built once per plant."""
     max_s = get_max_stage(plant_id)
-    items: List[ShopItem] = []
-    for n in range(1, max_s + 1):
-        name = f"Grow to Stage {n}"
-        cost = 100 * n
-        items.append(
-            ShopItem(id=f"upgrade_stage_{n}", name=name, cost=cost, description="", upgrade_stage=n)
-        )
-    return items
+    return tuple(
+        ShopItem(id=f"upgrade_stage_{n}", name=f"Grow to Stage {n}", cost=100 * n, description="", upgrade_stage=n)
+        for n in range(1, max_s + 1)
+    )
 
 
+@lru_cache(maxsize=None)
+def _upgrade_index(plant_id: str) -> Dict[str, ShopItem]:
+    """id -> stage upgrade item for this plant."""
+    return {item.id: item for item in get_stage_upgrade_items(plant_id)}
 
 
 def get_upgrade_item(item_id: str, plant_id: str) -> Optional[ShopItem]:
     """Return the stage upgrade item with the given id for this plant, or None."""
-    for item in get_stage_upgrade_items(plant_id):
-        if item.id == item_id:
-            return item
-    return None
+    return _upgrade_index(plant_id).get(item_id)
+
+
+def split_inventory(inventory: List[str]) -> Tuple[List[str], List[str]]:
+    """Partition inventory in one pass into (plant ids, pet ids), e.g. (['plant_rose'], ['cat'])."""
+    plants: List[str] = []
+    pets: List[str] = []
+    for item_id in inventory:
+        if item_id.startswith(PLANT_PREFIX):
+            plants.append(item_id)
+        elif item_id.startswith(PET_PREFIX):
+            pets.append(item_id[_PET_PREFIX_LEN:])
+    return plants, pets
+
+
+def _owned_ids(user_data: UserData) -> Tuple[List[str], List[str]]:
+    """Return (plant ids incl. default, pet ids) owned. Cached until inventory changes."""
+    cache = user_data._owned_cache
+    if cache is not None and cache[0] == len(user_data.inventory):
+        return cache[1], cache[2]
+    plants, pets = split_inventory(user_data.inventory)
+    plants.insert(0, DEFAULT_PLANT_ID)
+    user_data._owned_cache = (len(user_data.inventory), plants, pets)
+    return plants, pets
 
 
 def get_plants_owned(user_data: UserData) -> List[str]:
     """Return list of plant ids the user has (default plant + purchased from shop)."""
-    owned = [DEFAULT_PLANT_ID]
-    for item_id in user_data.inventory:
-        if item_id.startswith("plant_"):
-            owned.append(item_id)
-    return owned
+    return list(_owned_ids(user_data)[0])
 
 
 def get_pets_owned(user_data: UserData) -> List[str]:
     """Return list of pet ids the user has bought (e.g. ['person', 'cat'] from inventory 'pet_person', 'pet_cat')."""
-    return [item_id[4:] for item_id in user_data.inventory if item_id.startswith("pet_")]
+    return list(_owned_ids(user_data)[1])
 
 
+@lru_cache(maxsize=None)
 def get_plant_display_name(plant_id: str) -> str:
     """Default display name from plant id (e.g. plant_baby_cactus -> Baby Cactus)."""
     item = get_item(plant_id)
     if item:
         return item.name
-    if plant_id.startswith("plant_"):
-        return plant_id[6:].replace("_", " ").title()
+    if plant_id.startswith(PLANT_PREFIX):
+        return plant_id[_PLANT_PREFIX_LEN:].replace("_", " ").title()
     return plant_id.replace("_", " ").title()
 
 
@@ -102,7 +127,7 @@ def get_plant_display_name_for_user(plant_id: str, user_data: UserData) -> str:
 
 def get_pet_display_name(pet_id: str) -> str:
     """Default display name from pet id (e.g. person -> Person)."""
-    item = get_item(f"pet_{pet_id}")
+    item = get_item(PET_PREFIX + pet_id)
     if item:
         return item.name
     return pet_id.replace("_", " ").title()
@@ -119,12 +144,13 @@ def _active_plant_stage(user_data: UserData) -> int:
     return user_data.plant_stages.get(user_data.active_plant_id, 0)
 
 
-def can_afford(user_data: UserData, item_id: str) -> bool:
-    """True if user can buy this shop item (enough dewdrops, not already owned)."""
+def can_afford(user_data: UserData, item_id: str, owned: Optional[AbstractSet[str]] = None) -> bool:
+    """True if user can buy this shop item (enough dewdrops, not already owned).
+    owned: set(user_data.inventory), if the caller already built it for checking many items."""
     item = get_item(item_id)
     if item is None:
         return False
-    if item_id in user_data.inventory:
+    if item_id in (user_data.inventory if owned is None else owned):
         return False
     return user_data.currency_balance >= item.cost
 
@@ -145,6 +171,23 @@ def already_has_upgrade(user_data: UserData, item: ShopItem) -> bool:
     return _active_plant_stage(user_data) >= item.upgrade_stage
 
 
+# upgrade_status() bit flags
+UPGRADE_OWNED = 1
+UPGRADE_AFFORDABLE = 2
+
+
+def upgrade_status(user_data: UserData, item: ShopItem) -> int:
+    """Bitmask of UPGRADE_OWNED / UPGRADE_AFFORDABLE for this stage upgrade, from a single stage lookup."""
+    if item.upgrade_stage is None:
+        return 0
+    stage = _active_plant_stage(user_data)
+    if stage >= item.upgrade_stage:
+        return UPGRADE_OWNED
+    if user_data.currency_balance >= item.cost and stage == item.upgrade_stage - 1:
+        return UPGRADE_AFFORDABLE
+    return 0
+
+
 def purchase(user_data: UserData, item_id: str) -> bool:
     """If affordable and not owned: deduct cost, add to inventory; for plants only, init stage 0."""
     if not can_afford(user_data, item_id):
@@ -154,7 +197,7 @@ def purchase(user_data: UserData, item_id: str) -> bool:
         return False
     user_data.currency_balance -= item.cost
     user_data.inventory.append(item_id)
-    if item_id.startswith("plant_"):
+    if item_id.startswith(PLANT_PREFIX):
         user_data.plant_stages[item_id] = 0
     return True
 
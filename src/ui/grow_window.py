@@ -1,24 +1,29 @@
 """
 Grow window: stage upgrades only (separate from the shop).
 """
+import atexit
+import tkinter as tk
+from functools import partial
+
 import customtkinter as ctk
-from typing import Callable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional
 
 from ..data_handler import save_user_data
 from ..models import UserData
-from ..utils.image_loader import load_dewdrop_icon_pil
 from ..shop_manager import (
     get_plant_display_name_for_user,
     get_stage_upgrade_items,
     get_upgrade_item,
-    can_afford_upgrade,
-    already_has_upgrade,
+    upgrade_status,
     purchase_upgrade,
+    UPGRADE_AFFORDABLE,
 )
-from .styles import COLORS, FONTS
+from .icons import get_dewdrop_icon
+from .styles import COLORS, get_font
 
 PRICE_BTN_WIDTH = 52
 ROW_PADY = 4
+SAVE_DEBOUNCE_MS = 50  # coalesce a burst of purchases into one save
 
 
 class GrowWindow:
@@ -39,32 +44,47 @@ class GrowWindow:
         self.on_close = on_close
         self._win: Optional[ctk.CTkToplevel] = None
         self._balance_label: Optional[ctk.CTkLabel] = None
-        self._item_rows: List[Tuple[ctk.CTkLabel, ctk.CTkButton, str]] = []
+        self._item_rows: List[List[Any]] = []  # [name_lbl, price_btn, item_id, disabled]
+        self._dirty: bool = False
+        self._flush_after_id: Optional[str] = None
+        self._scroll: Optional[ctk.CTkScrollableFrame] = None
+        self._rows_plant_id: Optional[str] = None  # plant the current rows were built for
+        # One exit hook for the window's lifetime; _flush is a no-op when nothing is pending
+        atexit.register(self._flush)
 
     def show(self) -> None:
-        """Show the grow window (non-blocking)."""
-        self._win = ctk.CTkToplevel(self.parent)
+        """Show the grow window (non-blocking). The toplevel is built once and re-shown on later opens."""
+        if self._win is None or not self._win.winfo_exists():
+            self._build_window()
+        elif self._win.state() in ("normal", "iconic"):
+            # Already open (possibly minimized): just bring it back; on_open already ran for it
+            self._win.deiconify()
+            self._win.lift()
+            return
+        else:
+            self._win.deiconify()
+            self._win.lift()
         plant_name = get_plant_display_name_for_user(self.user_data.active_plant_id, self.user_data)
         self._win.title(f"Grow: {plant_name}")
+        if self.on_open:
+            self.on_open(self._win)
+        if self._rows_plant_id != self.user_data.active_plant_id:
+            self._rebuild_items()
+        else:
+            self._refresh_display()
+
+    def _build_window(self) -> None:
+        """Create the toplevel, balance header and (empty) scrollable item list."""
+        self._win = ctk.CTkToplevel(self.parent)
         self._win.geometry("320x380")
         self._win.minsize(280, 320)
         self._win.configure(fg_color=COLORS["cream"])
         self._win.transient(self.parent)
-        if self.on_open:
-            self.on_open(self._win)
 
         content = ctk.CTkFrame(self._win, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=20, pady=16)
 
-        dewdrop_pil = load_dewdrop_icon_pil()
-        dewdrop_ctk = None
-        if dewdrop_pil:
-            dewdrop_ctk = ctk.CTkImage(
-                light_image=dewdrop_pil,
-                dark_image=dewdrop_pil,
-                size=(dewdrop_pil.width, dewdrop_pil.height),
-            )
-            self._dewdrop_pil_ref = dewdrop_pil  # keep ref so CTkImage works
+        dewdrop_ctk = get_dewdrop_icon()
         balance_frame = ctk.CTkFrame(content, fg_color="transparent")
         balance_frame.pack(anchor="w", pady=(0, 14))
         balance_frame.grid_columnconfigure(0, weight=0)
@@ -74,78 +94,120 @@ class GrowWindow:
                 balance_frame,
                 text="",
                 image=dewdrop_ctk,
-                font=FONTS["heading"],
+                font=get_font("heading"),
                 text_color=COLORS["dark_text"],
             ).grid(row=0, column=0, padx=(0, 8), sticky="")
         self._balance_label = ctk.CTkLabel(
             balance_frame,
             text=f"{self.user_data.currency_balance} Dewdrops",
-            font=FONTS["heading"],
+            font=get_font("heading"),
             text_color=COLORS["dark_text"],
         )
         self._balance_label.grid(row=0, column=1, sticky="")
 
-        scroll = ctk.CTkScrollableFrame(content, fg_color="transparent")
-        scroll.pack(fill="both", expand=True)
+        self._scroll = ctk.CTkScrollableFrame(content, fg_color="transparent")
+        self._scroll.pack(fill="both", expand=True)
+        self._item_rows.clear()
+        self._rows_plant_id = None
+
+        self._win.protocol("WM_DELETE_WINDOW", self._close)
 
+    def _rebuild_items(self) -> None:
+        """Replace the upgrade rows with those for the active plant."""
+        for child in self._scroll.winfo_children():
+            child.destroy()
         self._item_rows.clear()
+        if self._balance_label:
+            self._balance_label.configure(text=f"{self.user_data.currency_balance} Dewdrops")
+        # Style lookups hoisted out of the per-row loop
+        font = get_font("default")
+        dark_text = COLORS["dark_text"]
+        sage_green = COLORS["sage_green"]
+        muted_teal = COLORS["muted_teal"]
+        light_text = COLORS["light_text"]
         active_plant_id = self.user_data.active_plant_id
         for item in get_stage_upgrade_items(active_plant_id):
-            row = ctk.CTkFrame(scroll, fg_color="transparent")
+            row = ctk.CTkFrame(self._scroll, fg_color="transparent")
             row.pack(fill="x", pady=ROW_PADY)
 
             lbl = ctk.CTkLabel(
                 row,
                 text=item.name,
-                font=FONTS["default"],
-                text_color=COLORS["dark_text"],
+                font=font,
+                text_color=dark_text,
             )
             lbl.pack(side="left", fill="x", expand=True, padx=(0, 12))
 
             btn = ctk.CTkButton(
                 row,
                 text=str(item.cost),
-                font=FONTS["default"],
-                fg_color=COLORS["sage_green"],
-                hover_color=COLORS["muted_teal"],
+                font=font,
+                fg_color=sage_green,
+                hover_color=muted_teal,
                 text_color="white",
                 width=PRICE_BTN_WIDTH,
                 height=28,
-                command=lambda iid=item.id: self._buy(iid),
+                command=partial(self._buy, item.id),
             )
-            if self._is_upgrade_disabled(item):
-                btn.configure(state="disabled", fg_color=COLORS["light_text"])
+            disabled = self._is_upgrade_disabled(item)
+            if disabled:
+                btn.configure(state="disabled", fg_color=light_text)
             btn.pack(side="right")
 
-            self._item_rows.append((lbl, btn, item.id))
+            self._item_rows.append([lbl, btn, item.id, disabled])
+        self._rows_plant_id = active_plant_id
 
-        def close_grow():
-            if self.on_close:
-                self.on_close(self._win)
-            self._win.destroy()
-
-        self._win.protocol("WM_DELETE_WINDOW", close_grow)
+    def _close(self) -> None:
+        """Flush pending saves and hide the window (kept alive for the next open)."""
+        self._flush()
+        if self.on_close:
+            self.on_close(self._win)
+        self._win.withdraw()
 
     def _is_upgrade_disabled(self, item) -> bool:
-        return already_has_upgrade(self.user_data, item) or not can_afford_upgrade(self.user_data, item)
+        return not upgrade_status(self.user_data, item) & UPGRADE_AFFORDABLE
 
     def _buy(self, item_id: str) -> None:
         item = get_upgrade_item(item_id, self.user_data.active_plant_id)
         if item is None or not purchase_upgrade(self.user_data, item):
             return
-        save_user_data(self.user_data)
+        self._schedule_save()
         self.on_purchase()
         self._refresh_display()
 
+    def _schedule_save(self) -> None:
+        """Mark data dirty and save once after a short delay; repeated purchases share one write."""
+        self._dirty = True
+        if self._flush_after_id is None:
+            self._flush_after_id = self._win.after(SAVE_DEBOUNCE_MS, self._flush)
+
+    def _flush(self) -> None:
+        """Write pending changes now (also runs on close and at exit so nothing is lost)."""
+        if self._flush_after_id is not None:
+            try:
+                self._win.after_cancel(self._flush_after_id)
+            except tk.TclError:
+                pass  # Tk already torn down (flush at exit)
+            self._flush_after_id = None
+        if self._dirty:
+            self._dirty = False
+            save_user_data(self.user_data)
+
     def _refresh_display(self) -> None:
         if self._balance_label:
             self._balance_label.configure(text=f"{self.user_data.currency_balance} Dewdrops")
         pid = self.user_data.active_plant_id
-        for lbl, btn, item_id in self._item_rows:
+        sage_green = COLORS["sage_green"]
+        light_text = COLORS["light_text"]
+        for row in self._item_rows:
+            lbl, btn, item_id, was_disabled = row
             item = get_upgrade_item(item_id, pid)
             if item:
                 disabled = self._is_upgrade_disabled(item)
+                if disabled == was_disabled:
+                    continue
+                row[3] = disabled
                 if disabled:
-                    btn.configure(state="disabled", fg_color=COLORS["light_text"])
+                    btn.configure(state="disabled", fg_color=light_text)
                 else:
-                    btn.configure(state="normal", fg_color=COLORS["sage_green"])
+                    btn.configure(state="normal", fg_color=sage_green)
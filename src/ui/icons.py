@@ -0,0 +1,21 @@
+"""
+Shared CTkImage icons. Each is decoded and wrapped once per process and reused by every window.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import customtkinter as ctk
+
+from ..utils.image_loader import load_dewdrop_icon_pil
+
+
+@lru_cache(maxsize=None)
+def get_dewdrop_icon() -> Optional[ctk.CTkImage]:
+    """Dewdrop icon for balance headers, or None if the asset is missing."""
+    dewdrop_pil = load_dewdrop_icon_pil()
+    if not dewdrop_pil:
+        return None
+    return ctk.CTkImage(
+        light_image=dewdrop_pil,
+        size=(dewdrop_pil.width, dewdrop_pil.height),
+    )
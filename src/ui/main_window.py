@@ -3,12 +3,14 @@ Main window for the Sprout & Study application.
 """
 import random
 import sys
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 import customtkinter as ctk
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from PIL import ImageTk
+from PIL import Image as PILImage, ImageTk
 
 from ..data_handler import load_user_data, save_user_data, UserData
 from ..shop_manager import (
@@ -17,27 +19,134 @@ from ..shop_manager import (
     get_pets_owned,
     get_pet_display_name_for_user,
 )
-from ..utils.image_loader import get_plant_image_path, load_dewdrop_icon_pil
+from ..utils.image_loader import ASSETS_DIR, get_plant_image_path, load_plant_image_fitted, warm_plant_caches
 from ..utils.pet_sprites import (
     load_pet_sprites,
     list_pets,
-    flip_frames,
+    _composite_onto_bg,
     PET_TRANSPARENT_KEY_HEX,
     PET_TRANSPARENT_KEY_RGB,
 )
-from .styles import COLORS, FONTS, WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT
+from .icons import get_dewdrop_icon
+from .styles import COLORS, get_font, WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT
 from .task_dialog import TaskDialog
 from .shop_window import ShopWindow
 from .grow_window import GrowWindow
 
 PET_SCALE = 2.5
 PET_MAX_DISPLAY_LARGE = 100  # person and cat (default in pet_sprites is 80)
-PET_SPEED = 2.0
+PET_SPEED = 2  # pixels per tick; positions and velocities are whole pixels
 # Cat sprite is offset within its cell when facing left/right; shift tooltip so it stays above the head
 CAT_TOOLTIP_OFFSET_X = 14
 PET_ANIM_MS = 120
+# Window resizes refit the plant image only after <Configure> has been quiet this long
+RESIZE_DEBOUNCE_MS = 80
+# Plant image fit bounds are rounded down to this many pixels (see _update_plant_image)
+PLANT_FIT_STEP = 16
 PET_STATE_MIN_SEC = 2.0
 PET_STATE_MAX_SEC = 5.0
+# Pet animation states; state_id indexes into each pet's photo_table / frame_counts
+PET_STATES = ("idle", "walk", "sit")
+STATE_IDX = {state: i for i, state in enumerate(PET_STATES)}
+_WALK_ID = STATE_IDX["walk"]
+# Remaining pet frames are prepared on a worker, then wrapped as PhotoImages this many per idle pass
+PET_PHOTO_BATCH = 8
+# How often the Tk thread checks on background image work
+IMAGE_POLL_MS = 30
+# Tcl proc taking a canvas path plus flat (item_id, x, y, image_name) quads
+PET_CANVAS_UPDATE_PROC = "_potted_pals_update_pets"
+# Pet.stacked_under value meaning "stacking unknown, restack on next placement"
+_RESTACK = object()
+
+
+def _prepare_pet_frame(pil_img: Any, keep_alpha: bool) -> Any:
+    """keep_alpha: keep RGBA (macOS); otherwise composite onto the color key (Windows)."""
+    if keep_alpha:
+        # load_pet_sprites already hands back RGBA on macOS; no per-frame convert needed
+        assert pil_img.mode == "RGBA", pil_img.mode
+    elif pil_img.mode == "RGBA":
+        # Same thresholded composite the loader uses, so key-colored edges stay crisp
+        pil_img = _composite_onto_bg(pil_img, PET_TRANSPARENT_KEY_RGB)
+    return pil_img
+
+
+def _prepare_pet_frames(sprites: Dict[str, List[Any]], keep_alpha: bool, max_frames: int) -> List[Any]:
+    """PIL-only work for a pet's photo table (safe off the Tk thread): right- and left-facing
+    frames laid out in photo_table order, None for unused slots. A sprite shared between states
+    (the loader reuses idle frames for a missing sit) maps to the same prepared images, so
+    _pet_wrap_photos uploads it to Tk only once."""
+    frames: List[Any] = [None] * (len(PET_STATES) * 2 * max_frames)
+    prepared: Dict[int, Tuple[Any, Any]] = {}
+    for state_id, state in enumerate(PET_STATES):
+        base = state_id * 2 * max_frames
+        for i, frame in enumerate(sprites.get(state) or ()):
+            pair = prepared.get(id(frame))
+            if pair is None:
+                pair = prepared[id(frame)] = (
+                    _prepare_pet_frame(frame, keep_alpha),
+                    _prepare_pet_frame(frame.transpose(PILImage.Transpose.FLIP_LEFT_RIGHT), keep_alpha),
+                )
+            frames[base + i], frames[base + max_frames + i] = pair
+    return frames
+
+
+class Pet:
+    """One wandering pet. Slotted because the animation tick reads these fields for every pet at 8 Hz."""
+
+    __slots__ = (
+        "pet_id", "sprites", "photo_table", "frame_counts", "max_frames",
+        "window", "label", "canvas", "canvas_image_id", "is_macos", "photo_ref", "placed",
+        "x", "y", "spawned", "state", "state_id", "frame_idx", "direction", "vx", "vy",
+        "cell_w", "cell_h", "state_change_at", "tooltip_after_id", "tooltip", "tooltip_size", "fallback_photo",
+        "stacked_under",
+    )
+
+    def __init__(
+        self,
+        pet_id: str,
+        sprites: Dict[str, List[Any]],
+        photo_table: List[Optional[ImageTk.PhotoImage]],
+        frame_counts: List[int],
+        max_frames: int,
+        cell_w: int,
+        cell_h: int,
+        window: Optional[tk.Toplevel] = None,
+        label: Optional[tk.Label] = None,
+        canvas: Optional[tk.Canvas] = None,
+        is_macos: bool = False,
+    ):
+        self.pet_id = pet_id
+        self.sprites = sprites
+        self.photo_table = photo_table
+        # Shown while the rest of photo_table is still being filled in
+        self.fallback_photo = next(p for p in photo_table if p is not None)
+        self.frame_counts = frame_counts
+        self.max_frames = max_frames
+        # Windows: own Toplevel + Label; macOS: item on the main scene canvas (window is None)
+        self.window = window
+        self.label = label
+        self.canvas = canvas
+        self.canvas_image_id: Optional[int] = None
+        self.is_macos = is_macos
+        self.photo_ref: Optional[ImageTk.PhotoImage] = None
+        self.placed: Optional[tuple] = None  # last position handed to Tk
+        # Toplevel pets: popup last lowered beneath (None = lifted over the main window); _RESTACK forces a restack
+        self.stacked_under: Any = _RESTACK
+        self.x: Optional[int] = None
+        self.y: Optional[int] = None
+        self.spawned = False
+        self.state = "idle"
+        self.state_id = STATE_IDX["idle"]
+        self.frame_idx = 0
+        self.direction = 1
+        self.vx = 0
+        self.vy = 0
+        self.cell_w = cell_w
+        self.cell_h = cell_h
+        self.state_change_at = 0.0
+        self.tooltip_after_id: Optional[str] = None
+        self.tooltip: Optional[tk.Toplevel] = None
+        self.tooltip_size: Tuple[int, int] = (0, 0)  # measured once when the tooltip is shown
 
 
 class MainWindow:
@@ -67,16 +176,31 @@ class MainWindow:
         self._scene_canvas: Optional[tk.Canvas] = None
         self._plant_canvas_img_id: Optional[int] = None
         self._plant_photo_ref: Optional[ImageTk.PhotoImage] = None
+        # (path, max_w, max_h) -> Tk/CTk image for the current plant+stage; PIL side is cached in image_loader
+        self._plant_photo_cache: Dict[tuple, Any] = {}
+        self._plant_photo_owner: Optional[tuple] = None
+        self._resize_after_id: Optional[str] = None
+        self._last_root_size: Optional[Tuple[int, int]] = None
 
-        # Pets: list of {sprites, sprites_left, window, label, photo_ref, x, y, state, frame_idx, direction, vx, vy, cell_w, cell_h, state_after_id}
-        self._pets: List[Dict[str, Any]] = []
+        self._pets: List[Pet] = []
         self._pet_after_id: Optional[str] = None
         self._pets_initialized: bool = False
         self._popup_count: int = 0
         self._popup_windows: List[Any] = []
-        self._dragging_pet: Optional[Dict[str, Any]] = None
-        self._drag_offset_x: float = 0.0
-        self._drag_offset_y: float = 0.0
+        self._dragging_pet: Optional[Pet] = None
+        self._drag_offset_x: int = 0
+        self._drag_offset_y: int = 0
+        self._grow_window: Optional[GrowWindow] = None
+        self._shop_window: Optional[ShopWindow] = None
+        self._plant_switcher: Optional[ctk.CTkToplevel] = None
+        self._plant_switcher_frame: Optional[ctk.CTkFrame] = None
+        self._plant_switcher_btns: List[Tuple[str, ctk.CTkButton]] = []  # (plant_id, button)
+        self._executor: Optional[ThreadPoolExecutor] = None  # see _image_executor
+        self._plant_image_gen: int = 0  # bumped per _update_plant_image; older worker results are dropped
+        # plant_frame (root_x, root_y, width, height); None until measured or after a <Configure>
+        self._plant_geom: Optional[tuple] = None
+        # (cell_w, cell_h) -> _pet_bounds result; cleared together with _plant_geom
+        self._bounds_cache: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
 
         # Create UI
         self._create_ui()
@@ -103,7 +227,7 @@ class MainWindow:
         self.add_task_button = ctk.CTkButton(
             btn_inner,
             text="+ Task",
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color=COLORS["sage_green"],
             hover_color=COLORS["muted_teal"],
             text_color="white",
@@ -116,7 +240,7 @@ class MainWindow:
         self.shop_button = ctk.CTkButton(
             btn_inner,
             text="Shop",
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color=COLORS["warm_beige"],
             hover_color=COLORS["soft_pink"],
             text_color=COLORS["dark_text"],
@@ -129,7 +253,7 @@ class MainWindow:
         self.grow_button = ctk.CTkButton(
             btn_inner,
             text="Grow",
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color=COLORS["sage_green"],
             hover_color=COLORS["muted_teal"],
             text_color="white",
@@ -145,14 +269,7 @@ class MainWindow:
         top_inner = ctk.CTkFrame(top_frame, fg_color="transparent")
         top_inner.pack(expand=True)
 
-        self._dewdrop_pil = load_dewdrop_icon_pil()
-        self._dewdrop_image = None
-        if self._dewdrop_pil:
-            self._dewdrop_image = ctk.CTkImage(
-                light_image=self._dewdrop_pil,
-                dark_image=self._dewdrop_pil,
-                size=(self._dewdrop_pil.width, self._dewdrop_pil.height),
-            )
+        self._dewdrop_image = get_dewdrop_icon()
         balance_frame = ctk.CTkFrame(top_inner, fg_color="transparent")
         balance_frame.pack(anchor="center")
         balance_frame.grid_columnconfigure(0, weight=0)
@@ -163,7 +280,7 @@ class MainWindow:
                 balance_frame,
                 text="",
                 image=self._dewdrop_image,
-                font=FONTS["heading"],
+                font=get_font("heading"),
                 text_color=COLORS["dark_text"],
             )
             dewdrop_lbl.grid(row=0, column=0, padx=(0, 8), sticky="")
@@ -171,7 +288,7 @@ class MainWindow:
         self.currency_label = ctk.CTkLabel(
             balance_frame,
             text="0 Dewdrops",
-            font=FONTS["heading"],
+            font=get_font("heading"),
             text_color=COLORS["dark_text"],
         )
         self.currency_label.grid(row=0, column=col, sticky="")
@@ -180,7 +297,7 @@ class MainWindow:
         self.plant_switcher_btn = ctk.CTkButton(
             top_inner,
             text=get_plant_display_name_for_user(self.user_data.active_plant_id, self.user_data),
-            font=FONTS["small"],
+            font=get_font("small"),
             fg_color=COLORS["warm_beige"],
             hover_color=COLORS["soft_pink"],
             text_color=COLORS["dark_text"],
@@ -196,6 +313,7 @@ class MainWindow:
             fg_color="transparent"
         )
         self.plant_frame.pack(fill="both", expand=True, padx=12, pady=6)
+        self.plant_frame.bind("<Configure>", self._on_plant_geom_changed, add="+")
 
         if sys.platform == "darwin":
             # macOS: use a Tk canvas for reliable RGBA transparency
@@ -206,6 +324,12 @@ class MainWindow:
                 bd=0,
             )
             self._scene_canvas.pack(fill="both", expand=True)
+            # One Tcl eval per tick moves and re-images every canvas pet (see _pet_tick)
+            self.root.tk.eval(
+                "proc " + PET_CANVAS_UPDATE_PROC + " {canvas args} {"
+                " foreach {id x y img} $args {"
+                " $canvas coords $id $x $y; $canvas itemconfigure $id -image $img } }"
+            )
         else:
             # Plant image label (Windows/Linux)
             self.plant_label = ctk.CTkLabel(
@@ -220,6 +344,9 @@ class MainWindow:
         root_tk = self.root.winfo_toplevel()
         root_tk.bind("<B1-Motion>", self._on_pet_drag_motion)
         root_tk.bind("<ButtonRelease-1>", self._on_pet_drag_release)
+        # Clicking or restoring the main window raises it over the pet windows
+        root_tk.bind("<FocusIn>", self._pet_mark_restack, add="+")
+        root_tk.bind("<Map>", self._pet_mark_restack, add="+")
 
         # Pet: init deferred so main window is laid out and winfo_rootx/y are valid
         self.root.after(150, self._init_pet)
@@ -244,7 +371,6 @@ class MainWindow:
         if not raw:
             return
         sprites = {k: list(v) for k, v in raw.items()}
-        sprites_left = {k: flip_frames(v) for k, v in raw.items()}
         first_frames = next((v for v in sprites.values() if v), None)
         if not first_frames:
             return
@@ -264,7 +390,6 @@ class MainWindow:
                 tk_scaling = 1.0
             if tk_scaling and tk_scaling > 1.01:
                 try:
-                    from PIL import Image as PILImage
                     mac_extra_shrink = 1.15  # >1.0 makes pets smaller
                     def _downscale_frame(img: PILImage.Image) -> PILImage.Image:
                         w, h = img.size
@@ -276,7 +401,6 @@ class MainWindow:
                         return img.resize((nw, nh), PILImage.Resampling.LANCZOS)
 
                     sprites = {k: [_downscale_frame(f) for f in frames] for k, frames in sprites.items()}
-                    sprites_left = {k: [_downscale_frame(f) for f in frames] for k, frames in sprites_left.items()}
                     first_frames = next((v for v in sprites.values() if v), None)
                     if not first_frames:
                         return
@@ -284,31 +408,22 @@ class MainWindow:
                 except Exception:
                     # If anything goes wrong, keep original sizes
                     pass
-            pet = {
-                "pet_id": pet_id,
-                "sprites": sprites,
-                "sprites_left": sprites_left,
-                "canvas_image_id": None,
-                "photo_ref": None,
-                "x": None,
-                "y": None,
-                "spawned": False,
-                "state": "idle",
-                "frame_idx": 0,
-                "direction": 1,
-                "vx": 0.0,
-                "vy": 0.0,
-                "cell_w": cell_w,
-                "cell_h": cell_h,
-                "state_after_id": None,
-                "tooltip_after_id": None,
-                "tooltip": None,
-            }
+            photo_table, frame_counts, max_frames = self._build_pet_photos(sprites, keep_alpha=True)
+            pet = Pet(
+                pet_id=pet_id,
+                sprites=sprites,
+                photo_table=photo_table,
+                frame_counts=frame_counts,
+                max_frames=max_frames,
+                cell_w=cell_w,
+                cell_h=cell_h,
+            )
             self._pets.append(pet)
             self._pet_show_frame_one(pet)
+            self._pet_load_photos(pet, keep_alpha=True)
             # Bind hover/drag to the canvas item once it exists
-            if pet.get("canvas_image_id") is not None:
-                item_id = pet["canvas_image_id"]
+            if pet.canvas_image_id is not None:
+                item_id = pet.canvas_image_id
                 self._scene_canvas.tag_bind(item_id, "<Enter>", lambda e, p=pet: self._pet_tooltip_schedule_show(p))
                 self._scene_canvas.tag_bind(item_id, "<Leave>", lambda e, p=pet: self._pet_tooltip_hide(p))
                 self._scene_canvas.tag_bind(item_id, "<ButtonPress-1>", lambda e, p=pet: (self._on_pet_drag_start(e, p), "break")[1])
@@ -340,7 +455,6 @@ class MainWindow:
             )
             canvas.pack()
             label = None  # Not using Label on macOS
-            canvas_image_id = None
         else:
             # Windows: use color-key transparency with composited images
             win.configure(bg=PET_TRANSPARENT_KEY_HEX)
@@ -352,32 +466,21 @@ class MainWindow:
             label = tk.Label(win, image=None, bg=label_bg, bd=0, highlightthickness=0)
             label.pack()
             canvas = None  # Not used on Windows
-            canvas_image_id = None  # Not used on Windows
         win.withdraw()
-        pet = {
-            "pet_id": pet_id,
-            "sprites": sprites,
-            "sprites_left": sprites_left,
-            "window": win,
-            "label": label,
-            "canvas": canvas,
-            "canvas_image_id": canvas_image_id,
-            "photo_ref": None,
-            "x": None,
-            "y": None,
-            "spawned": False,
-            "state": "idle",
-            "frame_idx": 0,
-            "direction": 1,
-            "vx": 0.0,
-            "vy": 0.0,
-            "cell_w": cell_w,
-            "cell_h": cell_h,
-            "state_after_id": None,
-            "tooltip_after_id": None,
-            "tooltip": None,
-            "is_macos": is_macos,
-        }
+        photo_table, frame_counts, max_frames = self._build_pet_photos(sprites, keep_alpha=is_macos)
+        pet = Pet(
+            pet_id=pet_id,
+            sprites=sprites,
+            photo_table=photo_table,
+            frame_counts=frame_counts,
+            max_frames=max_frames,
+            window=win,
+            label=label,
+            canvas=canvas,
+            cell_w=cell_w,
+            cell_h=cell_h,
+            is_macos=is_macos,
+        )
         win.bind("<Enter>", lambda e, p=pet: self._pet_tooltip_schedule_show(p))
         win.bind("<Leave>", lambda e, p=pet: self._pet_tooltip_hide(p))
         if label:
@@ -401,44 +504,109 @@ class MainWindow:
             canvas.bind("<B1-Motion>", drag_motion)
         self._pets.append(pet)
         self._pet_show_frame_one(pet)
+        self._pet_load_photos(pet, keep_alpha=is_macos)
         self._pet_schedule_state_change_one(pet)
 
+    def _build_pet_photos(
+        self,
+        sprites: Dict[str, List[Any]],
+        keep_alpha: bool,
+    ) -> Tuple[List[Optional[ImageTk.PhotoImage]], List[int], int]:
+        """Lay out a pet's photo table and wrap only its first frame, so spawning never waits on
+        the full conversion; _pet_load_photos fills in the rest.
+        Returns (photo_table, frame_counts, max_frames); photo_table is flat and indexed by
+        (state_id * 2 + facing_left) * max_frames + frame_idx."""
+        frame_counts = [len(sprites.get(state) or ()) for state in PET_STATES]
+        max_frames = max(frame_counts)
+        photo_table: List[Optional[ImageTk.PhotoImage]] = [None] * (len(PET_STATES) * 2 * max_frames)
+        for state_id, state in enumerate(PET_STATES):
+            frames = sprites.get(state)
+            if frames:
+                photo_table[state_id * 2 * max_frames] = ImageTk.PhotoImage(_prepare_pet_frame(frames[0], keep_alpha))
+                break
+        return photo_table, frame_counts, max_frames
+
+    def _pet_load_photos(self, pet: Pet, keep_alpha: bool) -> None:
+        """Prepare the remaining frames on a worker thread; the Tk wraps happen later at idle time."""
+        future = self._image_executor().submit(_prepare_pet_frames, pet.sprites, keep_alpha, pet.max_frames)
+        self.root.after(IMAGE_POLL_MS, self._pet_poll_photos, pet, future)
+
+    def _pet_poll_photos(self, pet: Pet, future: Future) -> None:
+        if not future.done():
+            self.root.after(IMAGE_POLL_MS, self._pet_poll_photos, pet, future)
+            return
+        try:
+            frames = future.result()
+        except Exception as e:
+            print(f"Error preparing pet frames for {pet.pet_id}: {e}")
+            return
+        # Wrap the facing the pet is showing now first; the mirrored set is only needed once it turns
+        face_left = (pet.direction == -1) != (pet.pet_id == "cat")
+        mf = pet.max_frames
+        order = [i for i, frame in enumerate(frames) if frame is not None]
+        order.sort(key=lambda i: (i // mf) % 2 != face_left)
+        self.root.after_idle(self._pet_wrap_photos, pet, frames, order, 0, {})
+
+    def _pet_wrap_photos(
+        self,
+        pet: Pet,
+        frames: List[Any],
+        order: List[int],
+        start: int,
+        wrapped: Dict[int, ImageTk.PhotoImage],
+    ) -> None:
+        """PhotoImage creation must stay on the Tk thread; do a few per idle pass so events keep flowing.
+        order lists the photo_table slots to fill; wrapped maps id(prepared frame) -> PhotoImage so
+        slots sharing a frame share one Tk image."""
+        table = pet.photo_table
+        end = min(start + PET_PHOTO_BATCH, len(order))
+        for i in order[start:end]:
+            frame = frames[i]
+            if table[i] is not None:
+                wrapped.setdefault(id(frame), table[i])
+                continue
+            photo = wrapped.get(id(frame))
+            if photo is None:
+                photo = wrapped[id(frame)] = ImageTk.PhotoImage(frame)
+            table[i] = photo
+        if end < len(order):
+            self.root.after_idle(self._pet_wrap_photos, pet, frames, order, end, wrapped)
+
     def _refresh_pets(self) -> None:
         """Add any newly purchased pets that are not yet in _pets (e.g. after shop purchase)."""
         available = list_pets()
         owned = get_pets_owned(self.user_data)
-        current_ids = [p["pet_id"] for p in self._pets]
+        current_ids = [p.pet_id for p in self._pets]
         root_tk = self.root.winfo_toplevel()
         added = False
         for pet_id in owned:
             if pet_id in available and pet_id not in current_ids:
                 self._add_pet(pet_id, root_tk)
                 added = True
-        if added and self._pets and self._pet_after_id is None:
+        if added:
             self._pet_schedule_tick()
 
-    def _pet_tooltip_schedule_show(self, pet: Dict[str, Any]) -> None:
+    def _pet_tooltip_schedule_show(self, pet: Pet) -> None:
         """Schedule showing the pet name tooltip after a short delay."""
-        if pet.get("tooltip_after_id") is not None:
-            self.root.after_cancel(pet["tooltip_after_id"])
-        pet["tooltip_after_id"] = self.root.after(400, lambda: self._pet_tooltip_show(pet))
+        if pet.tooltip_after_id is not None:
+            self.root.after_cancel(pet.tooltip_after_id)
+        pet.tooltip_after_id = self.root.after(400, lambda: self._pet_tooltip_show(pet))
 
-    def _pet_tooltip_position(self, pet: Dict[str, Any], tip_w: int, tip_h: int) -> Optional[tuple]:
+    def _pet_tooltip_position(self, pet: Pet, tip_w: int, tip_h: int) -> Optional[tuple]:
         """Return (tip_x, tip_y) to center the tooltip above the pet, or None if not available."""
-        if not pet.get("spawned") or pet.get("x") is None or pet.get("y") is None:
+        if not pet.spawned or pet.x is None or pet.y is None:
             return None
         try:
-            root_x = self.plant_frame.winfo_rootx()
-            root_y = self.plant_frame.winfo_rooty()
+            root_x, root_y, _, _ = self._plant_geometry()
         except tk.TclError:
             return None
-        pet_left = root_x + int(pet["x"])
-        pet_top = root_y + int(pet["y"])
-        cell_w = pet["cell_w"]
-        cell_h = pet["cell_h"]
+        pet_left = root_x + pet.x
+        pet_top = root_y + pet.y
+        cell_w = pet.cell_w
+        cell_h = pet.cell_h
         tip_x = pet_left + (cell_w - tip_w) // 2
-        if pet.get("pet_id") == "cat":
-            direction = pet.get("direction", 1)
+        if pet.pet_id == "cat":
+            direction = pet.direction
             if direction == -1:
                 tip_x -= CAT_TOOLTIP_OFFSET_X
             else:
@@ -448,18 +616,18 @@ class MainWindow:
             tip_y = pet_top + cell_h + 4
         return (tip_x, tip_y)
 
-    def _pet_tooltip_show(self, pet: Dict[str, Any]) -> None:
+    def _pet_tooltip_show(self, pet: Pet) -> None:
         """Show a tooltip with the pet's name centered above the pet."""
-        pet["tooltip_after_id"] = None
+        pet.tooltip_after_id = None
         self._pet_tooltip_hide(pet)
-        if not pet.get("spawned") or pet.get("x") is None or pet.get("y") is None:
+        if not pet.spawned or pet.x is None or pet.y is None:
             return
-        name = get_pet_display_name_for_user(pet["pet_id"], self.user_data)
+        name = get_pet_display_name_for_user(pet.pet_id, self.user_data)
         # macOS canvas pets don't have their own Toplevel window
         parent = self.root.winfo_toplevel()
-        if "window" in pet:
+        if pet.window is not None:
             try:
-                parent = pet["window"].winfo_toplevel()
+                parent = pet.window.winfo_toplevel()
             except Exception:
                 parent = self.root.winfo_toplevel()
         tip = tk.Toplevel(parent)
@@ -482,61 +650,50 @@ class MainWindow:
         pos = self._pet_tooltip_position(pet, tw, th)
         if pos is not None:
             tip.geometry(f"+{pos[0]}+{pos[1]}")
-        pet["tooltip"] = tip
+        pet.tooltip = tip
+        pet.tooltip_size = (tw, th)
 
-    def _pet_tooltip_reposition(self, pet: Dict[str, Any]) -> None:
-        """Update tooltip position to follow the pet (call each tick while tooltip is visible)."""
-        tip = pet.get("tooltip")
+    def _pet_tooltip_reposition(self, pet: Pet) -> None:
+        """Update tooltip position to follow the pet (called only when a pet with a visible tooltip moved)."""
+        tip = pet.tooltip
         if tip is None:
             return
-        try:
-            if not tip.winfo_exists():
-                pet["tooltip"] = None
-                return
-            tw = tip.winfo_reqwidth()
-            th = tip.winfo_reqheight()
-        except tk.TclError:
-            return
+        # The label text never changes while shown, so the size measured in _pet_tooltip_show still holds
+        tw, th = pet.tooltip_size
         pos = self._pet_tooltip_position(pet, tw, th)
         if pos is not None:
-            tip.geometry(f"+{pos[0]}+{pos[1]}")
+            try:
+                tip.geometry(f"+{pos[0]}+{pos[1]}")
+            except tk.TclError:
+                pet.tooltip = None  # destroyed behind our back
 
-    def _pet_tooltip_hide(self, pet: Dict[str, Any]) -> None:
+    def _pet_tooltip_hide(self, pet: Pet) -> None:
         """Cancel scheduled tooltip and hide/destroy the tooltip window."""
-        if pet.get("tooltip_after_id") is not None:
+        if pet.tooltip_after_id is not None:
             try:
-                self.root.after_cancel(pet["tooltip_after_id"])
+                self.root.after_cancel(pet.tooltip_after_id)
             except (tk.TclError, ValueError):
                 pass
-            pet["tooltip_after_id"] = None
-        if pet.get("tooltip") is not None:
+            pet.tooltip_after_id = None
+        if pet.tooltip is not None:
             try:
-                pet["tooltip"].destroy()
+                pet.tooltip.destroy()
             except tk.TclError:
                 pass
-            pet["tooltip"] = None
+            pet.tooltip = None
 
-    def _on_pet_drag_start(self, event: tk.Event, pet: Dict[str, Any]) -> None:
+    def _on_pet_drag_start(self, event: tk.Event, pet: Pet) -> None:
         """Start dragging this pet (mouse down on pet)."""
-        if not pet.get("spawned") or pet.get("x") is None or pet.get("y") is None:
+        if not pet.spawned or pet.x is None or pet.y is None:
             return
         self._pet_tooltip_hide(pet)
         try:
-            root_x = self.plant_frame.winfo_rootx()
-            root_y = self.plant_frame.winfo_rooty()
-            # Get mouse position in screen coordinates
-            if hasattr(event, 'x_root') and hasattr(event, 'y_root'):
-                mouse_x = event.x_root
-                mouse_y = event.y_root
-            else:
-                # Fallback: use widget coordinates + widget position
-                widget = event.widget
-                mouse_x = widget.winfo_rootx() + event.x
-                mouse_y = widget.winfo_rooty() + event.y
-            frame_x = mouse_x - root_x
-            frame_y = mouse_y - root_y
-            self._drag_offset_x = frame_x - pet["x"]
-            self._drag_offset_y = frame_y - pet["y"]
+            root_x, root_y, _, _ = self._plant_geometry()
+            # Button and motion events always carry screen coordinates
+            frame_x = event.x_root - root_x
+            frame_y = event.y_root - root_y
+            self._drag_offset_x = frame_x - pet.x
+            self._drag_offset_y = frame_y - pet.y
             self._dragging_pet = pet
         except (tk.TclError, AttributeError):
             return
@@ -547,24 +704,15 @@ class MainWindow:
             return
         pet = self._dragging_pet
         try:
-            root_x = self.plant_frame.winfo_rootx()
-            root_y = self.plant_frame.winfo_rooty()
-            # Get mouse position in screen coordinates
-            if hasattr(event, 'x_root') and hasattr(event, 'y_root'):
-                mouse_x = event.x_root
-                mouse_y = event.y_root
-            else:
-                # Fallback: use widget coordinates + widget position
-                widget = event.widget
-                mouse_x = widget.winfo_rootx() + event.x
-                mouse_y = widget.winfo_rooty() + event.y
-            frame_x = mouse_x - root_x
-            frame_y = mouse_y - root_y
+            root_x, root_y, _, _ = self._plant_geometry()
+            # Button and motion events always carry screen coordinates
+            frame_x = event.x_root - root_x
+            frame_y = event.y_root - root_y
             new_x = frame_x - self._drag_offset_x
             new_y = frame_y - self._drag_offset_y
-            min_x, max_x, min_y, max_y = self._pet_bounds(pet["cell_w"], pet["cell_h"])
-            pet["x"] = max(min_x, min(max_x, new_x))
-            pet["y"] = max(min_y, min(max_y, new_y))
+            min_x, max_x, min_y, max_y = self._pet_bounds(pet.cell_w, pet.cell_h)
+            pet.x = max(min_x, min(max_x, new_x))
+            pet.y = max(min_y, min(max_y, new_y))
             self._pet_place_one(pet)
             self._pet_tooltip_reposition(pet)
         except (tk.TclError, AttributeError):
@@ -574,11 +722,30 @@ class MainWindow:
         """Stop dragging (mouse up)."""
         self._dragging_pet = None
 
+    def _plant_geometry(self) -> tuple:
+        """Return plant_frame (root_x, root_y, width, height), cached until the next <Configure>."""
+        if self._plant_geom is None:
+            frame = self.plant_frame
+            self._plant_geom = (
+                frame.winfo_rootx(),
+                frame.winfo_rooty(),
+                frame.winfo_width(),
+                frame.winfo_height(),
+            )
+        return self._plant_geom
+
+    def _on_plant_geom_changed(self, event: Any = None) -> None:
+        """Plant area resized or window moved: re-measure on next use."""
+        self._plant_geom = None
+        self._bounds_cache.clear()
+
     def _pet_bounds(self, cell_w: int, cell_h: int) -> tuple:
-        """Return (min_x, max_x, min_y, max_y) for movement inside plant_frame."""
+        """Return (min_x, max_x, min_y, max_y) for movement inside plant_frame, cached per cell size."""
+        cached = self._bounds_cache.get((cell_w, cell_h))
+        if cached is not None:
+            return cached
         try:
-            w = self.plant_frame.winfo_width()
-            h = self.plant_frame.winfo_height()
+            _, _, w, h = self._plant_geometry()
             if w < 50 or h < 50:
                 rw = self.root.winfo_width()
                 rh = self.root.winfo_height()
@@ -594,198 +761,221 @@ class MainWindow:
             max_x = min_x
         if min_y > max_y:
             max_y = min_y
-        return (min_x, max_x, min_y, max_y)
+        bounds = (min_x, max_x, min_y, max_y)
+        self._bounds_cache[(cell_w, cell_h)] = bounds
+        return bounds
 
-    def _pet_place_one(self, pet: Dict[str, Any]) -> None:
-        """Position one pet. On macOS pets are canvas items; otherwise Toplevel windows."""
-        if not pet.get("spawned"):
-            return
+    def _pet_place_one(self, pet: Pet) -> bool:
+        """Position one pet. On macOS pets are canvas items; otherwise Toplevel windows.
+        Returns True if the pet actually moved (no Tk move call is made otherwise)."""
+        if not pet.spawned:
+            return False
         # macOS: canvas-rendered pets
-        if sys.platform == "darwin" and self._scene_canvas is not None and "canvas_image_id" in pet:
-            item_id = pet.get("canvas_image_id")
-            if item_id is None or pet.get("x") is None or pet.get("y") is None:
-                return
-            x = float(pet["x"]) + pet["cell_w"] / 2.0
-            y = float(pet["y"]) + pet["cell_h"] / 2.0
+        if sys.platform == "darwin" and self._scene_canvas is not None and pet.window is None:
+            item_id = pet.canvas_image_id
+            if item_id is None or pet.x is None or pet.y is None:
+                return False
+            x = pet.x + pet.cell_w // 2
+            y = pet.y + pet.cell_h // 2
+            placed = pet.placed
             try:
-                self._scene_canvas.coords(item_id, x, y)
+                if placed is None:
+                    self._scene_canvas.coords(item_id, x, y)
+                else:
+                    dx, dy = x - placed[0], y - placed[1]
+                    if not dx and not dy:
+                        return False
+                    self._scene_canvas.move(item_id, dx, dy)
             except tk.TclError:
-                return
-            return
+                return False
+            pet.placed = (x, y)
+            return True
         try:
-            root_x = self.plant_frame.winfo_rootx()
-            root_y = self.plant_frame.winfo_rooty()
+            root_x, root_y, _, _ = self._plant_geometry()
         except tk.TclError:
-            return
-        x = root_x + int(pet["x"])
-        y = root_y + int(pet["y"])
-        pet["window"].geometry(f"{pet['cell_w']}x{pet['cell_h']}+{x}+{y}")
-        pet["window"].deiconify()
-        if self._popup_count > 0 and self._popup_windows:
-            top_popup = None
-            for w in reversed(self._popup_windows):
-                try:
-                    if w.winfo_exists():
-                        top_popup = w
-                        break
-                except (tk.TclError, AttributeError):
-                    continue
-            if top_popup is not None:
-                try:
-                    pet["window"].lower(top_popup)
-                except tk.TclError:
-                    pass
-        else:
-            pet["window"].lift()
-
-    def _pet_show_frame_one(self, pet: Dict[str, Any]) -> None:
-        """Set one pet's label image. Run sprites only when moving (vx or vy != 0); reflect when moving left."""
-        state = pet["state"]
-        vx, vy = pet.get("vx", 0), pet.get("vy", 0)
-        is_moving = abs(vx) > 0.01 or abs(vy) > 0.01
-        if state == "walk" and not is_moving:
-            state = "idle"
-        face_left = pet["direction"] == -1
-        if pet.get("pet_id") == "cat":
+            return False
+        x = root_x + pet.x
+        y = root_y + pet.y
+        moved = pet.placed != (x, y)
+        if moved:
+            pet.window.geometry(f"{pet.cell_w}x{pet.cell_h}+{x}+{y}")
+            pet.window.deiconify()
+            pet.placed = (x, y)
+        # Restack only when the target changed or the main window may have been raised over pets
+        target = self._popup_windows[-1] if self._popup_windows else None
+        if pet.stacked_under is not target:
+            try:
+                if target is not None:
+                    pet.window.lower(target)  # keep pets visible but below the open popup
+                else:
+                    pet.window.lift()
+                pet.stacked_under = target
+            except tk.TclError:
+                pass  # e.g. popup not mapped yet; retried on the next placement
+        return moved
+
+    def _pet_mark_restack(self, event: Any = None) -> None:
+        """Main window raised or re-mapped (it can cover pets): restack pet windows on the next tick."""
+        for pet in self._pets:
+            pet.stacked_under = _RESTACK
+
+    def _pet_current_photo(self, pet: Pet) -> Optional[ImageTk.PhotoImage]:
+        """Photo for the pet's state, frame and facing. Run sprites only when moving (vx or vy != 0); reflect when moving left."""
+        state_id = pet.state_id
+        if state_id == _WALK_ID and not (pet.vx or pet.vy):
+            state_id = STATE_IDX["idle"]
+        count = pet.frame_counts[state_id]
+        if not count:
+            return None
+        face_left = pet.direction == -1
+        if pet.pet_id == "cat":
             face_left = not face_left
-        sprites = pet["sprites_left"] if face_left else pet["sprites"]
-        frames = sprites.get(state)
-        if not frames:
-            return
-        idx = pet["frame_idx"] % len(frames)
-        pil_img = frames[idx]
+        photo = pet.photo_table[(state_id * 2 + face_left) * pet.max_frames + pet.frame_idx % count]
+        if photo is None:
+            photo = pet.fallback_photo
+        return photo
+
+    def _pet_stage_canvas_update(self, pet: Pet, args: List[Any]) -> bool:
+        """Queue a placed canvas pet's new position and image onto args for PET_CANVAS_UPDATE_PROC.
+        Returns True if the pet moved."""
+        photo = self._pet_current_photo(pet)
+        if photo is None:
+            return False
+        x = pet.x + pet.cell_w // 2
+        y = pet.y + pet.cell_h // 2
+        moved = pet.placed != (x, y)
+        if not moved and photo is pet.photo_ref:
+            return False
+        args.extend((pet.canvas_image_id, x, y, str(photo)))
+        pet.photo_ref = photo
+        pet.placed = (x, y)
+        return moved
+
+    def _pet_show_frame_one(self, pet: Pet) -> None:
+        """Set one pet's label image (or canvas item image on macOS)."""
+        photo = self._pet_current_photo(pet)
+        if photo is None or photo is pet.photo_ref:
+            return  # nothing to show, or already showing this frame
+        pet.photo_ref = photo
         # macOS: canvas-rendered pets keep RGBA so alpha transparency works
-        if sys.platform == "darwin" and self._scene_canvas is not None and "canvas_image_id" in pet:
-            if pil_img.mode != "RGBA":
-                pil_img = pil_img.convert("RGBA")
-            pet["photo_ref"] = ImageTk.PhotoImage(pil_img)
-            if pet.get("canvas_image_id") is None:
+        if sys.platform == "darwin" and self._scene_canvas is not None and pet.window is None:
+            if pet.canvas_image_id is None:
                 try:
-                    pet["canvas_image_id"] = self._scene_canvas.create_image(
-                        pet["cell_w"] // 2,
-                        pet["cell_h"] // 2,
-                        image=pet["photo_ref"],
+                    pet.canvas_image_id = self._scene_canvas.create_image(
+                        pet.cell_w // 2,
+                        pet.cell_h // 2,
+                        image=photo,
                         anchor="center",
                     )
                 except tk.TclError:
                     return
             else:
                 try:
-                    self._scene_canvas.itemconfigure(pet["canvas_image_id"], image=pet["photo_ref"])
+                    self._scene_canvas.itemconfigure(pet.canvas_image_id, image=photo)
                 except tk.TclError:
                     return
             return
 
-        # Windows/other: existing Toplevel+Label rendering (color-key)
-        if pet.get("is_macos", False):
-            # Legacy macOS window-pet path (kept for safety; should not be used now)
-            if pil_img.mode != "RGBA":
-                pil_img = pil_img.convert("RGBA")
-            pet["photo_ref"] = ImageTk.PhotoImage(pil_img)
-            label = pet.get("label")
-            if label:
-                label.configure(image=pet["photo_ref"])
-            return
-
-        if pil_img.mode == "RGBA":
-            from PIL import Image as PILImage
-            rgb_img = PILImage.new("RGB", pil_img.size, PET_TRANSPARENT_KEY_RGB)
-            rgb_img.paste(pil_img, mask=pil_img.split()[3])
-            pil_img = rgb_img
-        pet["photo_ref"] = ImageTk.PhotoImage(pil_img)
-        label = pet.get("label")
+        # Windows/other: Toplevel+Label rendering (color-key, or RGBA on the legacy macOS window path)
+        label = pet.label
         if label:
-            label.configure(image=pet["photo_ref"])
+            label.configure(image=photo)
 
-    def _pet_schedule_tick(self) -> None:
-        if self._pet_after_id is not None:
-            self.root.after_cancel(self._pet_after_id)
-        if not self._pets:
+    def _pet_schedule_tick(self, delay_ms: int = PET_ANIM_MS) -> None:
+        """Schedule the next tick unless one is already pending (_pet_tick clears _pet_after_id on entry)."""
+        if self._pet_after_id is not None or not self._pets:
             return
-        self._pet_after_id = self.root.after(PET_ANIM_MS, self._pet_tick)
+        self._pet_after_id = self.root.after(delay_ms, self._pet_tick)
 
     def _pet_tick(self) -> None:
+        """Single animation clock for all pets: movement, frames and random state changes."""
         self._pet_after_id = None
         if not self._pets:
             return
-        self.root.update_idletasks()
+        started = time.monotonic()
+        self._pet_step_all(started)
+        # Draw in a second pass so the physics step runs as one batch over all pets
+        canvas_args: List[Any] = []
+        for pet in self._pets:
+            if pet.window is None and pet.placed is not None:
+                # Already on the macOS scene canvas: batched into one Tcl call below
+                moved = self._pet_stage_canvas_update(pet, canvas_args)
+            else:
+                self._pet_show_frame_one(pet)
+                moved = self._pet_place_one(pet)
+            if moved and pet.tooltip is not None:
+                self._pet_tooltip_reposition(pet)
+        if canvas_args:
+            try:
+                self.root.tk.call(PET_CANVAS_UPDATE_PROC, str(self._scene_canvas), *canvas_args)
+            except tk.TclError:
+                pass
+        # Subtract this tick's own work so the cadence stays at PET_ANIM_MS
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        self._pet_schedule_tick(max(1, PET_ANIM_MS - elapsed_ms))
+
+    def _pet_step_all(self, now: float) -> None:
+        """Advance position, bounce, animation frame and due state changes for every pet (no drawing)."""
         for pet in self._pets:
-            cw, ch = pet["cell_w"], pet["cell_h"]
+            cw, ch = pet.cell_w, pet.cell_h
             min_x, max_x, min_y, max_y = self._pet_bounds(cw, ch)
-            if not pet.get("spawned"):
-                pet["x"] = float(random.randint(min_x, max(max_x, min_x)))
-                pet["y"] = float(random.randint(min_y, max(max_y, min_y)))
-                pet["spawned"] = True
+            if not pet.spawned:
+                pet.x = random.randint(min_x, max(max_x, min_x))
+                pet.y = random.randint(min_y, max(max_y, min_y))
+                pet.spawned = True
             elif pet is self._dragging_pet:
                 pass
             else:
-                vx, vy = pet["vx"], pet["vy"]
-                if abs(vx) > 0.01 or abs(vy) > 0.01:
-                    pet["x"] += vx
-                    pet["y"] += vy
-                    if pet["x"] <= min_x:
-                        pet["x"] = min_x
-                        pet["vx"] = abs(pet["vx"])
-                    elif pet["x"] >= max_x:
-                        pet["x"] = max_x
-                        pet["vx"] = -abs(pet["vx"])
-                    if pet["y"] <= min_y:
-                        pet["y"] = min_y
-                        pet["vy"] = abs(pet["vy"])
-                    elif pet["y"] >= max_y:
-                        pet["y"] = max_y
-                        pet["vy"] = -abs(pet["vy"])
-                    if pet["vx"] < 0:
-                        pet["direction"] = -1
-                    elif pet["vx"] > 0:
-                        pet["direction"] = 1
-                pet["x"] = max(min_x, min(max_x, pet["x"]))
-                pet["y"] = max(min_y, min(max_y, pet["y"]))
-            frames = pet["sprites"].get(pet["state"]) or []
-            if frames:
-                pet["frame_idx"] = (pet["frame_idx"] + 1) % len(frames)
-            self._pet_show_frame_one(pet)
-            self._pet_place_one(pet)
-            self._pet_tooltip_reposition(pet)
-        self._pet_schedule_tick()
-
-    def _pet_schedule_state_change_one(self, pet: Dict[str, Any]) -> None:
-        if pet.get("state_after_id") is not None:
-            self.root.after_cancel(pet["state_after_id"])
-        delay_ms = int(1000 * (PET_STATE_MIN_SEC + random.random() * (PET_STATE_MAX_SEC - PET_STATE_MIN_SEC)))
-        pet["state_after_id"] = self.root.after(delay_ms, lambda p=pet: self._pet_state_change_one(p))
-
-    def _pet_state_change_one(self, pet: Dict[str, Any]) -> None:
-        pet["state_after_id"] = None
-        pet["state"] = random.choice(["idle", "walk", "sit"])
-        pet["frame_idx"] = 0
-        if pet["state"] == "walk":
-            pet["vx"] = PET_SPEED * random.choice((1, -1))
-            pet["vy"] = PET_SPEED * random.choice((1, -1))
-            pet["direction"] = -1 if pet["vx"] < 0 else 1
+                x, y, vx, vy = pet.x, pet.y, pet.vx, pet.vy
+                if vx or vy:
+                    x += vx
+                    y += vy
+                    # At an edge, point velocity back inward: the sign of (min + max - 2 * pos)
+                    if x <= min_x or x >= max_x:
+                        vx = pet.vx = abs(vx) if min_x + max_x >= 2 * x else -abs(vx)
+                    if y <= min_y or y >= max_y:
+                        pet.vy = abs(vy) if min_y + max_y >= 2 * y else -abs(vy)
+                    pet.direction = 1 if vx >= 0 else -1
+                pet.x = min(max(x, min_x), max_x)
+                pet.y = min(max(y, min_y), max_y)
+            if now >= pet.state_change_at:
+                self._pet_state_change_one(pet)
+                continue
+            count = pet.frame_counts[pet.state_id]
+            if count:
+                pet.frame_idx = (pet.frame_idx + 1) % count
+
+    def _pet_schedule_state_change_one(self, pet: Pet) -> None:
+        """Pick when this pet next changes state; the pet tick applies it once due."""
+        pet.state_change_at = time.monotonic() + random.uniform(PET_STATE_MIN_SEC, PET_STATE_MAX_SEC)
+
+    def _pet_state_change_one(self, pet: Pet) -> None:
+        state_id = random.randrange(len(PET_STATES))
+        pet.state = PET_STATES[state_id]
+        pet.state_id = state_id
+        pet.frame_idx = 0
+        if state_id == _WALK_ID:
+            # One random bit per axis picks +/- speed
+            pet.vx = PET_SPEED * (1 - (random.getrandbits(1) << 1))
+            pet.vy = PET_SPEED * (1 - (random.getrandbits(1) << 1))
+            pet.direction = -1 if pet.vx < 0 else 1
         else:
-            pet["vx"] = 0.0
-            pet["vy"] = 0.0
-        self._pet_show_frame_one(pet)
+            pet.vx = 0
+            pet.vy = 0
         self._pet_schedule_state_change_one(pet)
     
     def _on_popup_opened(self, popup_win: Any = None) -> None:
-        """Keep pets visible but below the menu window so they don't appear on top of it."""
+        """Keep pets visible but below the menu window so they don't appear on top of it.
+        Pets are lowered beneath the newest popup as they are placed (see _pet_place_one).
+        Idempotent per window, so a popup re-shown while already counted isn't registered twice."""
+        if popup_win is not None and popup_win in self._popup_windows:
+            return
         self._popup_count += 1
         if popup_win is not None:
             self._popup_windows.append(popup_win)
-        for pet in self._pets:
-            # macOS pets are canvas items (no separate Toplevel window)
-            win = pet.get("window")
-            if win is None:
-                continue
-            try:
-                if popup_win is not None:
-                    win.lower(popup_win)
-                else:
-                    win.lower()
-            except (tk.TclError, AttributeError, KeyError):
-                pass
+            for pet in self._pets:
+                if pet.window is not None:
+                    self._pet_place_one(pet)
 
     def _on_popup_closed(self, popup_win: Any = None) -> None:
         """Popup closed; stop forcing pets to stay behind it."""
@@ -794,42 +984,63 @@ class MainWindow:
             self._popup_windows.remove(popup_win)
 
     def _open_plant_switcher(self) -> None:
-        """Open a small popup to choose which plant to display."""
-        popup = ctk.CTkToplevel(self.root)
+        """Open a small popup to choose which plant to display. Built once, then hidden and re-shown."""
+        popup = self._plant_switcher
+        if popup is None or not popup.winfo_exists():
+            popup = self._plant_switcher = ctk.CTkToplevel(self.root)
+            popup.title("Choose plant")
+            popup.geometry("280x280")
+            popup.configure(fg_color=COLORS["cream"])
+            popup.transient(self.root)
+            popup.protocol("WM_DELETE_WINDOW", self._close_plant_switcher)
+            self._plant_switcher_frame = ctk.CTkFrame(popup, fg_color="transparent")
+            self._plant_switcher_frame.pack(fill="both", expand=True, padx=16, pady=16)
+            self._plant_switcher_btns = []
+        elif popup.state() in ("normal", "iconic"):
+            # Already open (possibly minimized): just bring it back
+            popup.deiconify()
+            popup.lift()
+            return
+        else:
+            popup.deiconify()
+            popup.lift()
         self._on_popup_opened(popup)
-        popup.title("Choose plant")
-        popup.geometry("280x280")
-        popup.configure(fg_color=COLORS["cream"])
-        popup.transient(self.root)
-
-        def close_plant_switcher():
-            self._on_popup_closed(popup)
-            popup.destroy()
-
-        popup.protocol("WM_DELETE_WINDOW", close_plant_switcher)
-        frame = ctk.CTkFrame(popup, fg_color="transparent")
-        frame.pack(fill="both", expand=True, padx=16, pady=16)
-        for pid in get_plants_owned(self.user_data):
-            row = ctk.CTkFrame(frame, fg_color="transparent")
-            row.pack(fill="x", pady=4)
-            name = get_plant_display_name_for_user(pid, self.user_data)
-            btn = ctk.CTkButton(
-                row,
-                text=name,
-                font=FONTS["default"],
-                fg_color=COLORS["warm_beige"] if pid == self.user_data.active_plant_id else COLORS["sage_green"],
-                hover_color=COLORS["soft_pink"],
-                text_color=COLORS["dark_text"],
-                command=lambda p=pid, w=popup: self._select_plant_and_close(p, w),
+        owned = get_plants_owned(self.user_data)
+        if [pid for pid, _ in self._plant_switcher_btns] != owned:
+            # A plant was bought since the buttons were built
+            for child in self._plant_switcher_frame.winfo_children():
+                child.destroy()
+            self._plant_switcher_btns = []
+            for pid in owned:
+                row = ctk.CTkFrame(self._plant_switcher_frame, fg_color="transparent")
+                row.pack(fill="x", pady=4)
+                btn = ctk.CTkButton(
+                    row,
+                    text="",
+                    font=get_font("default"),
+                    hover_color=COLORS["soft_pink"],
+                    text_color=COLORS["dark_text"],
+                    command=partial(self._select_plant_and_close, pid),
+                )
+                btn.pack(side="left", fill="x", expand=True)
+                self._plant_switcher_btns.append((pid, btn))
+        # Names can change (rename) and the highlight follows the active plant
+        active = self.user_data.active_plant_id
+        for pid, btn in self._plant_switcher_btns:
+            btn.configure(
+                text=get_plant_display_name_for_user(pid, self.user_data),
+                fg_color=COLORS["warm_beige"] if pid == active else COLORS["sage_green"],
             )
-            btn.pack(side="left", fill="x", expand=True)
 
-    def _select_plant_and_close(self, plant_id: str, popup: ctk.CTkToplevel) -> None:
+    def _close_plant_switcher(self) -> None:
+        self._on_popup_closed(self._plant_switcher)
+        self._plant_switcher.withdraw()
+
+    def _select_plant_and_close(self, plant_id: str) -> None:
         """Set active plant, save, close popup, refresh main window."""
         self.user_data.active_plant_id = plant_id
         save_user_data(self.user_data)
-        self._on_popup_closed(popup)
-        popup.destroy()
+        self._close_plant_switcher()
         self._update_display()
 
     def _update_display(self):
@@ -843,7 +1054,6 @@ class MainWindow:
     def _update_plant_image(self):
         """Load and display the plant stage image."""
         stage = self.user_data.plant_stages.get(self.user_data.active_plant_id, 0)
-        assets_dir = Path(__file__).resolve().parent.parent.parent / "assets"
 
         window_width = self.root.winfo_width()
         window_height = self.root.winfo_height()
@@ -853,17 +1063,40 @@ class MainWindow:
             window_height = WINDOW_DEFAULT_HEIGHT
         padding_h = 48
         reserved_vertical = 168
-        max_width = window_width - padding_h
-        max_height = window_height - reserved_vertical
+        # Snap to a PLANT_FIT_STEP grid so dragging the window edge reuses cached fits
+        max_width = (window_width - padding_h) // PLANT_FIT_STEP * PLANT_FIT_STEP
+        max_height = (window_height - reserved_vertical) // PLANT_FIT_STEP * PLANT_FIT_STEP
         max_width = max(120, min(max_width, 240))
         max_height = max(140, min(max_height, 240))
 
         plant_id = self.user_data.active_plant_id
         image_path = get_plant_image_path(plant_id, stage)
-        full_path = assets_dir / image_path
+        if self._plant_photo_owner != (plant_id, stage):
+            self._plant_photo_cache.clear()
+            self._plant_photo_owner = (plant_id, stage)
+        cache_key = (image_path, max_width, max_height)
+        # Any load still in flight is now stale; _plant_poll_image drops results from older generations
+        self._plant_image_gen += 1
+        cached = self._plant_photo_cache.get(cache_key)
+        if cached is not None:
+            self._plant_show_photo(cached)
+            return
+        # Decode + resize on the worker so a cold load never stalls the event loop
+        future = self._image_executor().submit(load_plant_image_fitted, ASSETS_DIR / image_path, max_width, max_height)
+        self.root.after(IMAGE_POLL_MS, self._plant_poll_image, future, self._plant_image_gen, cache_key)
 
+    def _plant_poll_image(self, future: Future, gen: int, cache_key: tuple) -> None:
+        """Wait for a worker plant load, then wrap it for Tk and show it (unless superseded)."""
+        if gen != self._plant_image_gen:
+            return  # a newer request replaced this one; the fitted image still lands in the loader cache
+        if not future.done():
+            self.root.after(IMAGE_POLL_MS, self._plant_poll_image, future, gen, cache_key)
+            return
+        image_path = cache_key[0]
         try:
-            if not full_path.exists():
+            try:
+                img = future.result()
+            except FileNotFoundError:
                 if sys.platform == "darwin" and self._scene_canvas is not None:
                     # Clear plant image on canvas
                     if self._plant_canvas_img_id is not None:
@@ -875,46 +1108,54 @@ class MainWindow:
                 else:
                     self.plant_label.configure(image="", text=f"Image not found:\n{image_path}")
                 return
-            from PIL import Image
-
-            img = Image.open(full_path).convert("RGBA")
-            w, h = img.size
-            if w and h:
-                scale = min(max_width / w, max_height / h, 1.0)
-                disp_w, disp_h = int(w * scale), int(h * scale)
-                img = img.resize((disp_w, disp_h), Image.Resampling.LANCZOS)
             self._plant_pil_image = img
             if sys.platform == "darwin" and self._scene_canvas is not None:
-                # Draw plant on canvas so pets can be RGBA on top
-                self._plant_photo_ref = ImageTk.PhotoImage(img)
-                self._scene_canvas.update_idletasks()
-                cw = max(1, self._scene_canvas.winfo_width())
-                ch = max(1, self._scene_canvas.winfo_height())
-                x = cw // 2
-                y = ch // 2
-                if self._plant_canvas_img_id is None:
-                    self._plant_canvas_img_id = self._scene_canvas.create_image(
-                        x, y, image=self._plant_photo_ref, anchor="center"
-                    )
-                    # Ensure plant is behind pets
-                    self._scene_canvas.tag_lower(self._plant_canvas_img_id)
-                else:
-                    self._scene_canvas.itemconfigure(self._plant_canvas_img_id, image=self._plant_photo_ref)
-                    self._scene_canvas.coords(self._plant_canvas_img_id, x, y)
-                    self._scene_canvas.tag_lower(self._plant_canvas_img_id)
+                photo = ImageTk.PhotoImage(img)
             else:
-                self.plant_image = ctk.CTkImage(
+                photo = ctk.CTkImage(
                     light_image=img,
-                    dark_image=img,
                     size=(img.width, img.height),
                 )
-                self.plant_label.configure(image=self.plant_image, text="")
+            self._plant_photo_cache[cache_key] = photo
+            self._plant_show_photo(photo)
         except Exception as e:
             print(f"Error loading plant image: {e}")
             if sys.platform == "darwin":
                 return
             self.plant_label.configure(image="", text="Error loading image")
-    
+
+    def _plant_show_photo(self, photo: Any) -> None:
+        """Display a plant image from _plant_photo_cache (PhotoImage on the macOS canvas, CTkImage otherwise)."""
+        if sys.platform == "darwin" and self._scene_canvas is not None:
+            # Draw plant on canvas so pets can be RGBA on top
+            self._scene_canvas.update_idletasks()
+            cw = max(1, self._scene_canvas.winfo_width())
+            ch = max(1, self._scene_canvas.winfo_height())
+            x = cw // 2
+            y = ch // 2
+            if self._plant_canvas_img_id is None:
+                self._plant_photo_ref = photo
+                self._plant_canvas_img_id = self._scene_canvas.create_image(
+                    x, y, image=self._plant_photo_ref, anchor="center"
+                )
+                # Ensure plant is behind pets
+                self._scene_canvas.tag_lower(self._plant_canvas_img_id)
+            else:
+                # A currency-only refresh keeps the same photo; then only re-centre it
+                if photo is not self._plant_photo_ref:
+                    self._plant_photo_ref = photo
+                    self._scene_canvas.itemconfigure(self._plant_canvas_img_id, image=self._plant_photo_ref)
+                self._scene_canvas.coords(self._plant_canvas_img_id, x, y)
+        elif photo is not self.plant_image:
+            self.plant_image = photo
+            self.plant_label.configure(image=self.plant_image, text="")
+
+    def _image_executor(self) -> ThreadPoolExecutor:
+        """Single background worker for PIL work (pet frames, plant images); Tk objects stay on this thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="images")
+        return self._executor
+
     def _on_add_task_clicked(self):
         """Handle Add Task button click: show task dialog, add dewdrops, update growth, save, refresh."""
         result = TaskDialog(
@@ -930,39 +1171,65 @@ class MainWindow:
         self._update_display()
     
     def _on_shop_clicked(self):
-        """Open shop (plants only)."""
-        ShopWindow(
-            self.root,
-            self.user_data,
-            self._update_display,
-            on_open=self._on_popup_opened,
-            on_close=self._on_popup_closed,
-        ).show()
+        """Open shop. One instance is reused so its widgets survive between opens."""
+        if self._shop_window is None:
+            self._shop_window = ShopWindow(
+                self.root,
+                self.user_data,
+                self._update_display,
+                on_open=self._on_popup_opened,
+                on_close=self._on_popup_closed,
+            )
+        self._shop_window.show()
 
     def _on_grow_clicked(self):
-        """Open grow window (stage upgrades only)."""
-        GrowWindow(
-            self.root,
-            self.user_data,
-            self._update_display,
-            on_open=self._on_popup_opened,
-            on_close=self._on_popup_closed,
-        ).show()
+        """Open grow window (stage upgrades only). One instance is reused so its widgets survive between opens."""
+        if self._grow_window is None:
+            self._grow_window = GrowWindow(
+                self.root,
+                self.user_data,
+                self._update_display,
+                on_open=self._on_popup_opened,
+                on_close=self._on_popup_closed,
+            )
+        self._grow_window.show()
     
     def run(self):
         """Start the application main loop."""
         # Bind window resize to update plant image
         self.root.bind('<Configure>', self._on_window_resize)
+        # Scan the remaining plant folders in the background, queued behind the pet frames
+        self._image_executor().submit(warm_plant_caches)
         self.root.mainloop()
     
     def _on_window_resize(self, event):
-        """Handle window resize to update plant image size and clamp pet position."""
+        """Handle window resize: plant image and pet clamping run once the resize settles."""
         if event.widget == self.root:
-            self._update_plant_image()
-            for pet in self._pets:
-                if not pet.get("spawned"):
-                    continue
-                min_x, max_x, min_y, max_y = self._pet_bounds(pet["cell_w"], pet["cell_h"])
-                pet["x"] = max(min_x, min(max_x, pet["x"]))
-                pet["y"] = max(min_y, min(max_y, pet["y"]))
+            # Moves change screen offsets too, so drop cached geometry on every event
+            self._on_plant_geom_changed()
+            size = (event.width, event.height)
+            if size == self._last_root_size:
+                # Moved, or a no-op Configure: pet windows follow now, nothing needs refitting
+                for pet in self._pets:
+                    if pet.window is not None:
+                        self._pet_place_one(pet)
+                return
+            self._last_root_size = size
+            if self._resize_after_id is not None:
+                self.root.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.root.after(RESIZE_DEBOUNCE_MS, self._do_resize)
+
+    def _do_resize(self) -> None:
+        """Refit the plant image and clamp pets into the resized plant area."""
+        self._resize_after_id = None
+        self._update_plant_image()
+        for pet in self._pets:
+            if not pet.spawned:
+                continue
+            min_x, max_x, min_y, max_y = self._pet_bounds(pet.cell_w, pet.cell_h)
+            x = min(max(pet.x, min_x), max_x)
+            y = min(max(pet.y, min_y), max_y)
+            if x != pet.x or y != pet.y:
+                # Only pets pushed back inside need placing now; the rest follow on the next tick
+                pet.x, pet.y = x, y
                 self._pet_place_one(pet)
@@ -4,7 +4,7 @@ Dialog to set a custom name for a plant.
 import customtkinter as ctk
 from typing import Optional
 
-from .styles import COLORS, FONTS
+from .styles import COLORS, get_font
 
 
 class RenamePlantDialog:
@@ -34,6 +34,8 @@ class RenamePlantDialog:
         self._dialog.geometry("320x140")
         self._dialog.configure(fg_color=COLORS["cream"])
         self._dialog.transient(self.parent)
+        # Opened from the shop window: raise explicitly so the grab never lands on a dialog hidden under it
+        self._dialog.lift(self.parent)
         self._dialog.grab_set()
 
         content = ctk.CTkFrame(self._dialog, fg_color="transparent")
@@ -42,13 +44,13 @@ class RenamePlantDialog:
         ctk.CTkLabel(
             content,
             text=self.prompt,
-            font=FONTS["default"],
+            font=get_font("default"),
             text_color=COLORS["dark_text"],
         ).pack(anchor="w", pady=(0, 8))
 
         self._entry = ctk.CTkEntry(
             content,
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color="white",
             text_color=COLORS["dark_text"],
             placeholder_text=self.default_name,
@@ -64,7 +66,7 @@ class RenamePlantDialog:
         ctk.CTkButton(
             btn_frame,
             text="Cancel",
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color=COLORS["light_text"],
             hover_color=COLORS["warm_beige"],
             text_color=COLORS["dark_text"],
@@ -75,7 +77,7 @@ class RenamePlantDialog:
         ctk.CTkButton(
             btn_frame,
             text="OK",
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color=COLORS["sage_green"],
             hover_color=COLORS["muted_teal"],
             text_color="white",
@@ -3,22 +3,21 @@ Shop window: list of items, purchase with dewdrops, inventory tracked.
 """
 import customtkinter as ctk
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from ..data_handler import save_user_data
 from ..models import UserData
 from ..shop_manager import (
     get_shop_plant_items,
     get_shop_pet_items,
-    get_item,
     can_afford,
     purchase,
     get_pets_owned,
     get_pet_display_name,
     get_pet_display_name_for_user,
 )
-from ..utils.image_loader import load_dewdrop_icon_pil
-from .styles import COLORS, FONTS
+from .icons import get_dewdrop_icon
+from .styles import COLORS, get_font
 from .rename_dialog import RenamePlantDialog
 
 # Button width for price (e.g. "500" fits)
@@ -44,31 +43,41 @@ class ShopWindow:
         self.on_close = on_close
         self._win: Optional[ctk.CTkToplevel] = None
         self._balance_label: Optional[ctk.CTkLabel] = None
-        self._item_rows: List[Tuple[ctk.CTkLabel, ctk.CTkButton, str]] = []  # (name_lbl, price_btn, item_id)
+        self._item_rows: List[List[Any]] = []  # [name_lbl, price_btn, item, disabled]
+        self._your_pet_rows: List[Tuple[str, ctk.CTkLabel]] = []
+        self._your_pets_frame: Optional[ctk.CTkFrame] = None
+        self._pets_label: Optional[ctk.CTkLabel] = None
+        self._your_pet_ids: Optional[Tuple[str, ...]] = None  # owned pets the "Your pets" rows were built for
 
     def show(self) -> None:
-        """Show the shop window (non-blocking)."""
+        """Show the shop window (non-blocking). The toplevel is built once and re-shown on later opens."""
+        if self._win is None or not self._win.winfo_exists():
+            self._build_window()
+        elif self._win.state() in ("normal", "iconic"):
+            # Already open (possibly minimized): just bring it back; on_open already ran for it
+            self._win.deiconify()
+            self._win.lift()
+            return
+        else:
+            self._win.deiconify()
+            self._win.lift()
+        if self.on_open:
+            self.on_open(self._win)
+        self._refresh_display()
+
+    def _build_window(self) -> None:
+        """Create the toplevel and every shop row; _refresh_display keeps them current afterwards."""
         self._win = ctk.CTkToplevel(self.parent)
         self._win.title("Shop")
         self._win.geometry("320x480")
         self._win.minsize(280, 360)
         self._win.configure(fg_color=COLORS["cream"])
         self._win.transient(self.parent)
-        if self.on_open:
-            self.on_open(self._win)
 
         content = ctk.CTkFrame(self._win, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=20, pady=16)
 
-        dewdrop_pil = load_dewdrop_icon_pil()
-        dewdrop_ctk = None
-        if dewdrop_pil:
-            dewdrop_ctk = ctk.CTkImage(
-                light_image=dewdrop_pil,
-                dark_image=dewdrop_pil,
-                size=(dewdrop_pil.width, dewdrop_pil.height),
-            )
-            self._dewdrop_pil_ref = dewdrop_pil
+        dewdrop_ctk = get_dewdrop_icon()
         balance_frame = ctk.CTkFrame(content, fg_color="transparent")
         balance_frame.pack(anchor="w", pady=(0, 14))
         balance_frame.grid_columnconfigure(0, weight=0)
@@ -78,13 +87,13 @@ class ShopWindow:
                 balance_frame,
                 text="",
                 image=dewdrop_ctk,
-                font=FONTS["heading"],
+                font=get_font("heading"),
                 text_color=COLORS["dark_text"],
             ).grid(row=0, column=0, padx=(0, 8), sticky="")
         self._balance_label = ctk.CTkLabel(
             balance_frame,
             text=f"{self.user_data.currency_balance} Dewdrops",
-            font=FONTS["heading"],
+            font=get_font("heading"),
             text_color=COLORS["dark_text"],
         )
         self._balance_label.grid(row=0, column=1, sticky="")
@@ -93,70 +102,32 @@ class ShopWindow:
         scroll.pack(fill="both", expand=True)
 
         self._item_rows.clear()
-        self._your_pet_rows: List[Tuple[str, ctk.CTkLabel]] = []
-
-        your_pets = get_pets_owned(self.user_data)
-        if your_pets:
-            your_pets_label = ctk.CTkLabel(
-                scroll,
-                text="Your pets",
-                font=FONTS["heading"],
-                text_color=COLORS["dark_text"],
-            )
-            your_pets_label.pack(anchor="w", pady=(0, 8))
-            for pet_id in your_pets:
-                row = ctk.CTkFrame(scroll, fg_color="transparent")
-                row.pack(fill="x", pady=ROW_PADY)
-                name = get_pet_display_name_for_user(pet_id, self.user_data)
-                default = get_pet_display_name(pet_id)
-                # Show default name in parentheses if there's a custom name
-                if name != default:
-                    display_name = f"{name} ({default})"
-                else:
-                    display_name = name
-                lbl = ctk.CTkLabel(
-                    row,
-                    text=display_name,
-                    font=FONTS["default"],
-                    text_color=COLORS["dark_text"],
-                )
-                lbl.pack(side="left", fill="x", expand=True, padx=(0, 12))
-                self._your_pet_rows.append((pet_id, lbl))
-                ctk.CTkButton(
-                    row,
-                    text="Rename",
-                    font=FONTS["small"],
-                    fg_color=COLORS["warm_beige"],
-                    hover_color=COLORS["soft_pink"],
-                    text_color=COLORS["dark_text"],
-                    width=64,
-                    height=28,
-                    command=lambda pid=pet_id: self._rename_pet(pid),
-                ).pack(side="right")
-            spacer = ctk.CTkLabel(scroll, text="", font=FONTS["default"])
-            spacer.pack(anchor="w", pady=(0, 4))
+        # "Your pets" lives in its own frame so it can be rebuilt after a purchase without touching the rest
+        self._your_pets_frame = ctk.CTkFrame(scroll, fg_color="transparent")
+        self._your_pet_rows.clear()
+        self._your_pet_ids = None
 
-        pets_label = ctk.CTkLabel(
+        self._pets_label = ctk.CTkLabel(
             scroll,
             text="Pets to buy",
-            font=FONTS["heading"],
+            font=get_font("heading"),
             text_color=COLORS["dark_text"],
         )
-        pets_label.pack(anchor="w", pady=(0, 8))
+        self._pets_label.pack(anchor="w", pady=(0, 8))
         for item in get_shop_pet_items():
             row = ctk.CTkFrame(scroll, fg_color="transparent")
             row.pack(fill="x", pady=ROW_PADY)
             lbl = ctk.CTkLabel(
                 row,
                 text=item.name,
-                font=FONTS["default"],
+                font=get_font("default"),
                 text_color=COLORS["dark_text"],
             )
             lbl.pack(side="left", fill="x", expand=True, padx=(0, 12))
             btn = ctk.CTkButton(
                 row,
                 text=str(item.cost),
-                font=FONTS["default"],
+                font=get_font("default"),
                 fg_color=COLORS["sage_green"],
                 hover_color=COLORS["muted_teal"],
                 text_color="white",
@@ -164,15 +135,16 @@ class ShopWindow:
                 height=28,
                 command=lambda iid=item.id: self._buy(iid),
             )
-            if self._is_item_disabled(item):
+            disabled = not can_afford(self.user_data, item.id)
+            if disabled:
                 btn.configure(state="disabled", fg_color=COLORS["light_text"])
             btn.pack(side="right")
-            self._item_rows.append((lbl, btn, item.id))
+            self._item_rows.append([lbl, btn, item, disabled])
 
         plants_label = ctk.CTkLabel(
             scroll,
             text="Plants",
-            font=FONTS["heading"],
+            font=get_font("heading"),
             text_color=COLORS["dark_text"],
         )
         plants_label.pack(anchor="w", pady=(16, 8))
@@ -182,14 +154,14 @@ class ShopWindow:
             lbl = ctk.CTkLabel(
                 row,
                 text=item.name,
-                font=FONTS["default"],
+                font=get_font("default"),
                 text_color=COLORS["dark_text"],
             )
             lbl.pack(side="left", fill="x", expand=True, padx=(0, 12))
             btn = ctk.CTkButton(
                 row,
                 text=str(item.cost),
-                font=FONTS["default"],
+                font=get_font("default"),
                 fg_color=COLORS["sage_green"],
                 hover_color=COLORS["muted_teal"],
                 text_color="white",
@@ -197,20 +169,62 @@ class ShopWindow:
                 height=28,
                 command=lambda iid=item.id: self._buy(iid),
             )
-            if self._is_item_disabled(item):
+            disabled = not can_afford(self.user_data, item.id)
+            if disabled:
                 btn.configure(state="disabled", fg_color=COLORS["light_text"])
             btn.pack(side="right")
-            self._item_rows.append((lbl, btn, item.id))
+            self._item_rows.append([lbl, btn, item, disabled])
 
-        def close_shop():
-            if self.on_close:
-                self.on_close(self._win)
-            self._win.destroy()
+        self._win.protocol("WM_DELETE_WINDOW", self._close)
 
-        self._win.protocol("WM_DELETE_WINDOW", close_shop)
+    def _rebuild_your_pets(self, your_pets: List[str]) -> None:
+        """(Re)create the "Your pets" rows for the currently owned pets."""
+        frame = self._your_pets_frame
+        for child in frame.winfo_children():
+            child.destroy()
+        self._your_pet_rows.clear()
+        self._your_pet_ids = tuple(your_pets)
+        if not your_pets:
+            frame.pack_forget()
+            return
+        your_pets_label = ctk.CTkLabel(
+            frame,
+            text="Your pets",
+            font=get_font("heading"),
+            text_color=COLORS["dark_text"],
+        )
+        your_pets_label.pack(anchor="w", pady=(0, 8))
+        for pet_id in your_pets:
+            row = ctk.CTkFrame(frame, fg_color="transparent")
+            row.pack(fill="x", pady=ROW_PADY)
+            lbl = ctk.CTkLabel(
+                row,
+                text="",  # filled in by _refresh_display
+                font=get_font("default"),
+                text_color=COLORS["dark_text"],
+            )
+            lbl.pack(side="left", fill="x", expand=True, padx=(0, 12))
+            self._your_pet_rows.append((pet_id, lbl))
+            ctk.CTkButton(
+                row,
+                text="Rename",
+                font=get_font("small"),
+                fg_color=COLORS["warm_beige"],
+                hover_color=COLORS["soft_pink"],
+                text_color=COLORS["dark_text"],
+                width=64,
+                height=28,
+                command=lambda pid=pet_id: self._rename_pet(pid),
+            ).pack(side="right")
+        spacer = ctk.CTkLabel(frame, text="", font=get_font("default"))
+        spacer.pack(anchor="w", pady=(0, 4))
+        frame.pack(fill="x", before=self._pets_label)
 
-    def _is_item_disabled(self, item) -> bool:
-        return item.id in self.user_data.inventory or not can_afford(self.user_data, item.id)
+    def _close(self) -> None:
+        """Hide the window; it is kept alive for the next open."""
+        if self.on_close:
+            self.on_close(self._win)
+        self._win.withdraw()
 
     def _rename_pet(self, pet_id: str) -> None:
         """Open rename dialog for this pet and save."""
@@ -240,10 +254,13 @@ class ShopWindow:
         self._refresh_display()
 
     def _refresh_display(self) -> None:
-        """Update balance, your-pet names, and gray out price buttons when not available."""
+        """Update balance, your-pet rows and names, and gray out price buttons when not available."""
         if self._balance_label:
             self._balance_label.configure(text=f"{self.user_data.currency_balance} Dewdrops")
-        for pet_id, lbl in getattr(self, "_your_pet_rows", []):
+        your_pets = get_pets_owned(self.user_data)
+        if self._your_pets_frame is not None and tuple(your_pets) != self._your_pet_ids:
+            self._rebuild_your_pets(your_pets)
+        for pet_id, lbl in self._your_pet_rows:
             name = get_pet_display_name_for_user(pet_id, self.user_data)
             default = get_pet_display_name(pet_id)
             # Show default name in parentheses if there's a custom name
@@ -252,11 +269,16 @@ class ShopWindow:
             else:
                 display_name = name
             lbl.configure(text=display_name)
-        for lbl, btn, item_id in self._item_rows:
-            item = get_item(item_id)
-            if item:
-                disabled = self._is_item_disabled(item)
-                if disabled:
-                    btn.configure(state="disabled", fg_color=COLORS["light_text"])
-                else:
-                    btn.configure(state="normal", fg_color=COLORS["sage_green"])
+        owned = set(self.user_data.inventory)
+        sage_green = COLORS["sage_green"]
+        light_text = COLORS["light_text"]
+        for row in self._item_rows:
+            lbl, btn, item, was_disabled = row
+            disabled = not can_afford(self.user_data, item.id, owned)
+            if disabled == was_disabled:
+                continue
+            row[3] = disabled
+            if disabled:
+                btn.configure(state="disabled", fg_color=light_text)
+            else:
+                btn.configure(state="normal", fg_color=sage_green)
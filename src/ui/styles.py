@@ -2,6 +2,10 @@
 Color scheme and styling constants for the application.
 Custom fonts: Comfortaa, Quicksand (install from Google Fonts if not present).
 """
+from functools import lru_cache
+
+import customtkinter as ctk
+
 # Color Palette (Cozy, soft pastel - from project description)
 COLORS = {
     "eggshell": "#F0EAD6",
@@ -21,6 +25,14 @@ FONTS = {
     "small": ("Comfortaa", 10),
 }
 
+
+@lru_cache(maxsize=None)
+def get_font(name: str) -> ctk.CTkFont:
+    """Shared CTkFont for a FONTS entry, so widgets don't each parse a font tuple.
+    Call only after the Tk root exists (CTkFont needs it)."""
+    family, size, *rest = FONTS[name]
+    return ctk.CTkFont(family=family, size=size, weight=rest[0] if rest else "normal")
+
 # Window settings (windowed, not fullscreen; compact so tall plants fit when scaled)
 WINDOW_DEFAULT_WIDTH = 280
 WINDOW_DEFAULT_HEIGHT = 380
@@ -5,7 +5,7 @@ import customtkinter as ctk
 from typing import Optional, Callable
 
 from ..models import TASKS
-from .styles import COLORS, FONTS
+from .styles import COLORS, get_font
 
 
 class TaskDialog:
@@ -43,7 +43,7 @@ class TaskDialog:
         label = ctk.CTkLabel(
             content,
             text="What did you do? (Earn Dewdrops!)",
-            font=FONTS["heading"],
+            font=get_font("heading"),
             text_color=COLORS["dark_text"],
         )
         label.pack(anchor="w", pady=(0, 12))
@@ -55,7 +55,7 @@ class TaskDialog:
                 text=task_label,
                 variable=self._var,
                 value=task_id,
-                font=FONTS["default"],
+                font=get_font("default"),
                 text_color=COLORS["dark_text"],
                 fg_color=COLORS["sage_green"],
                 hover_color=COLORS["muted_teal"],
@@ -68,7 +68,7 @@ class TaskDialog:
         ctk.CTkButton(
             btn_frame,
             text="Cancel",
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color=COLORS["light_text"],
             hover_color=COLORS["dark_text"],
             text_color="white",
@@ -79,7 +79,7 @@ class TaskDialog:
         ctk.CTkButton(
             btn_frame,
             text="Submit",
-            font=FONTS["default"],
+            font=get_font("default"),
             fg_color=COLORS["sage_green"],
             hover_color=COLORS["muted_teal"],
             text_color="white",
@@ -2,44 +2,65 @@
 Image loading utility using Pillow.
 Plant assets live in assets/plants/{folder}/{folder}_stage_N.png; each folder may have a different number of stages.
 """
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from PIL import Image, ImageTk
 
 
-ASSETS_DIR = (Path(__file__).resolve().parent.parent.parent / "assets").resolve()
+ASSETS_DIR = Path(__file__).resolve().parent.parent.parent / "assets"  # resolved once at import
 PLANTS_DIR = (ASSETS_DIR / "plants").resolve()
 DEWDROP_ICON_MAX = 24  # match heading text size (~16pt); aspect ratio preserved
+# Plant downscale filters: LANCZOS for big reductions, cheaper BILINEAR when shrinking by less than half
+PLANT_RESAMPLE_FILTER = Image.Resampling.LANCZOS
+PLANT_RESAMPLE_FILTER_MILD = Image.Resampling.BILINEAR
 
 
+@lru_cache(maxsize=None)
 def load_dewdrop_icon_pil() -> Optional[Image.Image]:
-    """Load and resize the water_drop icon for balance display. Preserves aspect ratio. Returns PIL Image or None."""
+    """
+    Load and resize the water_drop icon for balance display. Preserves aspect ratio. Returns PIL Image or None.
+    Decoded once per process (cache_clear() to reload); the returned image is shared, so callers must not modify it.
+    """
     path = ASSETS_DIR / "icons" / "water_drop.png"
     if not path.exists():
         return None
     try:
-        img = Image.open(path).convert("RGBA")
-        w, h = img.size
-        if not w or not h:
-            return img
-        scale = min(DEWDROP_ICON_MAX / w, DEWDROP_ICON_MAX / h, 1.0)
-        new_w, new_h = int(w * scale), int(h * scale)
-        if new_w < 1:
-            new_w = 1
-        if new_h < 1:
-            new_h = 1
-        return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        # thumbnail() shrinks in place (never enlarges) and keeps the aspect ratio; in RGBa so its
+        # default reducing_gap applies (see load_plant_image_fitted). 24px icon: LANCZOS buys nothing.
+        img = Image.open(path).convert("RGBA").convert("RGBa")  # P/LA sources only reach RGBa via RGBA
+        img.thumbnail((DEWDROP_ICON_MAX, DEWDROP_ICON_MAX), Image.Resampling.BILINEAR)
+        return img.convert("RGBA")
     except Exception as e:
         print(f"Error loading dewdrop icon: {e}")
         return None
 
-# Cache max stage per folder (folder_name -> int)
-_max_stage_cache: Dict[str, int] = {}
+@lru_cache(maxsize=32)
+def _load_image_pil(full_path: Path, size: Optional[tuple]) -> Image.Image:
+    """Decoded RGB (transparency composited onto white), resized if size is given. Shared; don't modify."""
+    img = Image.open(full_path)
+    img.load()  # the cached image must not hold the file open
+
+    # Convert RGBA to RGB if needed for better compatibility
+    if img.mode == 'RGBA':
+        # Create a white background
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img)  # RGBA mask uses its alpha band; no split() copies
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    if size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
 
 
 def load_image(image_path: Path, size: Optional[tuple] = None) -> Optional[ImageTk.PhotoImage]:
     """
     Load an image from the given path and optionally resize it.
+    The decoded/resized PIL image is cached per (path, size); each call still returns its own PhotoImage.
     
     Args:
         image_path: Path to the image file
@@ -55,26 +76,14 @@ def load_image(image_path: Path, size: Optional[tuple] = None) -> Optional[Image
             print(f"Image not found: {full_path}")
             return None
         
-        img = Image.open(full_path)
-        
-        # Convert RGBA to RGB if needed for better compatibility
-        if img.mode == 'RGBA':
-            # Create a white background
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])  # Use alpha channel as mask
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
-        
-        if size:
-            img = img.resize(size, Image.Resampling.LANCZOS)
-        
+        img = _load_image_pil(full_path, tuple(size) if size else None)
         return ImageTk.PhotoImage(img)
     except Exception as e:
         print(f"Error loading image {image_path}: {e}")
         return None
 
 
+@lru_cache(maxsize=None)
 def get_plant_folder(plant_id: str) -> str:
     """Return the folder name for this plant_id (e.g. plant_rose -> rose). Unknown folders fall back to shrub."""
     if plant_id.startswith("plant_"):
@@ -86,36 +95,95 @@ def get_plant_folder(plant_id: str) -> str:
     return folder
 
 
+@lru_cache(maxsize=None)
+def _scan_stage_files(folder: str) -> Tuple[int, Dict[int, str]]:
+    """
+    One scan of plants/{folder}: (highest stage number, 0-based; {stage: file name} for the exact
+    {folder}_stage_N.png/.jpg names, .png preferred). Cached per folder.
+    """
+    # {folder}_stage_N.png, or {folder}_stage_N_anything.jpg (counts toward the max, never picked as the image)
+    pattern = re.compile(rf"{re.escape(folder)}_stage_(\d+)(_.*)?\.(?i:(png)|jpg)")
+    max_n = -1
+    files: Dict[int, str] = {}
+    try:
+        # Plain name strings from scandir; no Path object per entry
+        with os.scandir(PLANTS_DIR / folder) as entries:
+            for entry in entries:
+                m = pattern.fullmatch(entry.name)
+                if m is None:
+                    continue
+                n = int(m.group(1))
+                max_n = max(max_n, n)
+                if m.group(2) is None and (m.group(3) or n not in files):
+                    files[n] = entry.name
+    except OSError:  # missing folder (or not a directory)
+        return 0, {}
+    return max(0, max_n), files
+
+
+def warm_plant_caches() -> None:
+    """Fill the stage cache for every plant folder in one pass over PLANTS_DIR, so the shop
+    and plant switcher never scan a folder on first use. Safe to run off the Tk thread."""
+    try:
+        with os.scandir(PLANTS_DIR) as entries:
+            folders = [entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")]
+    except OSError:
+        return
+    for folder in folders:
+        _scan_stage_files(folder)
+
+
 def get_max_stage(plant_id: str) -> int:
     """Return the highest stage number (0-based) available for this plant by scanning the folder."""
-    folder = get_plant_folder(plant_id)
-    if folder in _max_stage_cache:
-        return _max_stage_cache[folder]
-    folder_path = PLANTS_DIR / folder
-    if not folder_path.is_dir():
-        _max_stage_cache[folder] = 0
-        return 0
-    prefix = f"{folder}_stage_"
-    max_n = -1
-    for f in folder_path.iterdir():
-        if f.suffix.lower() in (".png", ".jpg") and f.stem.startswith(prefix):
-            rest = f.stem[len(prefix) :]
-            if rest.isdigit():
-                max_n = max(max_n, int(rest))
-            elif "_" in rest and rest.split("_")[0].isdigit():
-                max_n = max(max_n, int(rest.split("_")[0]))
-    _max_stage_cache[folder] = max(0, max_n)
-    return _max_stage_cache[folder]
+    return _scan_stage_files(get_plant_folder(plant_id))[0]
 
 
+@lru_cache(maxsize=None)
 def get_plant_image_path(plant_id: str, stage: int) -> Path:
     """Get the path to a plant stage image under plants/{folder}/{folder}_stage_N.png."""
     folder = get_plant_folder(plant_id)
-    max_s = get_max_stage(plant_id)
+    max_s, files = _scan_stage_files(folder)
     stage = max(0, min(max_s, int(stage)))
-    name = f"{folder}_stage_{stage}"
-    for ext in (".png", ".jpg"):
-        path = Path("plants") / folder / f"{name}{ext}"
-        if (ASSETS_DIR / path).exists():
-            return path
-    return Path("plants") / folder / f"{name}.png"
+    # Looked up in the folder scan rather than stat()ing each candidate extension
+    return Path("plants") / folder / files.get(stage, f"{folder}_stage_{stage}.png")
+
+
+@lru_cache(maxsize=2)
+def _decode_plant_image(path: Path) -> Image.Image:
+    """
+    Decoded source: premultiplied RGBa if the asset has transparency, plain RGB otherwise (no alpha
+    plane to carry through the resize). Assets don't change while the app runs (see clear_plant_caches).
+    Only the shown plant needs its full-size decode (~4 MB) kept for re-fitting on resize; fitted
+    results are cached by load_plant_image_fitted, so two entries cover a plant or stage switch.
+    """
+    img = Image.open(path)
+    img.load()
+    if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+        # Pillow only converts RGBA straight to RGBa; palette+tRNS and LA/PA go through RGBA first
+        return img.convert("RGBA").convert("RGBa")
+    return img.convert("RGB")
+
+
+@lru_cache(maxsize=32)
+def load_plant_image_fitted(full_path: Path, max_width: int, max_height: int) -> Image.Image:
+    """
+    Load a plant stage image (RGBA, or RGB for opaque assets), scaled down (never up) to fit max_width x max_height.
+    Results are cached, so repeated resizes to the same bounds skip the decode and LANCZOS pass.
+    The returned image is shared; callers must not modify it. Raises FileNotFoundError if missing.
+    """
+    img = _decode_plant_image(full_path)
+    w, h = img.size
+    if w and h:
+        scale = min(max_width / w, max_height / h, 1.0)
+        if scale < 1.0:
+            # Resizing RGBA directly ignores reducing_gap, so work in RGBa: a cheap integer
+            # reduce() pass first, then the filter over the last <= 2x (as Image.thumbnail does)
+            resample = PLANT_RESAMPLE_FILTER if scale < 0.5 else PLANT_RESAMPLE_FILTER_MILD
+            img = img.resize((int(w * scale), int(h * scale)), resample, reducing_gap=2.0)
+    return img.convert("RGBA") if img.mode == "RGBa" else img
+
+
+def clear_plant_caches() -> None:
+    """Forget cached plant folders, stage counts, paths and decoded images (e.g. after assets change on disk)."""
+    for cached in (get_plant_folder, _scan_stage_files, get_plant_image_path, _decode_plant_image, load_plant_image_fitted):
+        cached.cache_clear()
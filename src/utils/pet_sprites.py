@@ -4,7 +4,11 @@ Format: assets/pets/{pet_id}/{Action}/__*_NNN.png (e.g. Idle, Run, Sit).
 Actions are mapped: Idle->idle, Run->walk, Sit->sit. Sprites face right; flip for left-facing.
 For transparency: Windows uses color-key (magenta), macOS uses RGBA with transparent window.
 """
+import atexit
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -24,6 +28,13 @@ ACTION_MAP = {"Idle": "idle", "Run": "walk", "Sit": "sit"}
 # Cap so pet never fills the window (cat/person assets can be large)
 MAX_PET_DISPLAY = 80
 
+# Frames of one action are decoded in parallel (see _frame_executor)
+FRAME_LOAD_WORKERS = min(4, os.cpu_count() or 1)
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Alpha -> 1-bit mask lookup for _composite_onto_bg, built once instead of per frame
+_ALPHA_MASK_LUT: List[int] = [255 if p > 128 else 0 for p in range(256)]
+
 
 def list_pets() -> List[str]:
     """Return pet ids (folder names) in assets/pets, e.g. ['cat', 'person']."""
@@ -38,24 +49,62 @@ def list_pets() -> List[str]:
 def _composite_onto_bg(rgba: Image.Image, bg_rgb: Tuple[int, int, int]) -> Image.Image:
     """Composite RGBA onto opaque background; alpha > 128 = opaque for clean transparent key."""
     bg = Image.new("RGB", rgba.size, bg_rgb)
-    alpha = rgba.split()[3]
-    mask = alpha.point(lambda p: 255 if p > 128 else 0, mode="1")
-    bg.paste(rgba.convert("RGB"), mask=mask)
+    mask = rgba.getchannel("A").point(_ALPHA_MASK_LUT, "1")
+    bg.paste(rgba, mask=mask)  # explicit mask: only rgba's colour bands are copied
     return bg
 
 
-def _cap_to_max_size(img: Image.Image, max_side: int) -> Image.Image:
-    """Scale down image so the longer side is at most max_side; preserve aspect ratio."""
-    w, h = img.size
+@lru_cache(maxsize=None)
+def _list_action_frames(pet_id: str) -> Tuple[Tuple[str, Tuple[Path, ...]], ...]:
+    """
+    ((action_dir_name, frame_paths), ...) for assets/pets/{pet_id}, actions and frames sorted by name.
+    Actions without any .png frames are left out. Scanned once per pet; a missing pet folder raises
+    OSError, which lru_cache doesn't memoize, so the folder is looked for again next time.
+    """
+    pet_dir = PETS_DIR / pet_id
+    with os.scandir(pet_dir) as entries:
+        action_names = sorted(e.name for e in entries if e.is_dir())
+    actions = []
+    for action_name in action_names:
+        action_dir = pet_dir / action_name
+        with os.scandir(action_dir) as entries:
+            names = sorted(
+                e.name for e in entries
+                if not e.name.startswith(".") and e.name.lower().endswith(".png")
+            )
+        if names:
+            actions.append((action_name, tuple(action_dir / name for name in names)))
+    return tuple(actions)
+
+
+def _final_size(w: int, h: int, scale: float, max_side: int) -> Tuple[int, int]:
+    """Displayed frame size for a w x h source: scaled, then capped so the longer side is at most
+    max_side (aspect ratio preserved, never below 1px). Frames are resized to this in one pass."""
+    if scale != 1.0:
+        w, h = int(w * scale), int(h * scale)
     if w <= max_side and h <= max_side:
-        return img
-    scale = max_side / max(w, h)
-    new_size = (int(w * scale), int(h * scale))
+        return (w, h)
+    cap = max_side / max(w, h)
+    new_size = (int(w * cap), int(h * cap))
     if new_size[0] < 1:
-        new_size = (1, max(1, int(h * scale)))
+        new_size = (1, max(1, int(h * cap)))
     if new_size[1] < 1:
-        new_size = (max(1, int(w * scale)), 1)
-    return img.resize(new_size, Image.Resampling.LANCZOS)
+        new_size = (max(1, int(w * cap)), 1)
+    return new_size
+
+
+def _resize_frame(img: Image.Image, new_size: Tuple[int, int]) -> Image.Image:
+    """Resize an RGBA or RGB frame. Enlarging (sprites shown big) uses LANCZOS; small reductions use cheaper
+    BILINEAR, which looks the same there. Reductions of 3x or more go two-stage: a cheap integer
+    reduce() pass, then LANCZOS over the last <= 2x (reducing_gap needs RGBa, see load_plant_image_fitted)."""
+    src_side, dst_side = max(img.size), max(new_size)
+    if dst_side >= src_side:
+        return img.resize(new_size, Image.Resampling.LANCZOS)
+    if src_side < 3 * dst_side:
+        return img.resize(new_size, Image.Resampling.BILINEAR)
+    if img.mode != "RGBA":
+        return img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+    return img.convert("RGBa").resize(new_size, Image.Resampling.LANCZOS, reducing_gap=2.0).convert("RGBA")
 
 
 def load_pet_sprites(
@@ -68,7 +117,10 @@ def load_pet_sprites(
     Load frames for one pet from assets/pets/{pet_id}/{Action}/.
     pet_id: folder name (e.g. 'person', 'cat'). If None, uses default from list_pets() (prefers "person").
     Frames are scaled, then capped so the longer side is at most max_display_size, then composited.
+    On macOS every frame is RGBA; elsewhere every frame is RGB composited onto background_rgb.
     Returns {"idle": [...], "walk": [...], "sit": [...]} with at least idle and walk, or None.
+    Frames are cached per argument set and shared between calls (don't modify them); the dict and
+    lists are fresh copies.
     """
     if background_rgb is None:
         background_rgb = PET_TRANSPARENT_KEY_RGB
@@ -77,54 +129,105 @@ def load_pet_sprites(
         if not pets:
             return None
         pet_id = "person" if "person" in pets else pets[0]
-    pet_dir = PETS_DIR / pet_id
-    if not pet_dir.is_dir():
-        return None
+    # Failures raise out of the cached loader, so they aren't memoized and a later call retries
     try:
-        result: Dict[str, List[Image.Image]] = {}
-        action_dirs = sorted(p for p in pet_dir.iterdir() if p.is_dir())
-        for action_dir in action_dirs:
-            action_name = action_dir.name
-            internal_key = ACTION_MAP.get(action_name, action_name.lower())
-            paths = sorted(action_dir.glob("*.png"))
-            if not paths:
-                continue
-            frames = []
-            for path in paths:
-                img = Image.open(path).convert("RGBA")
-                w, h = img.size
-                if scale != 1.0:
-                    new_size = (int(w * scale), int(h * scale))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                img = _cap_to_max_size(img, max_display_size)
-                # On macOS, keep RGBA for transparency with transparent window
-                # On Windows, composite onto color key for color-key transparency
-                if sys.platform == "darwin":
-                    frames.append(img)  # Keep RGBA for macOS transparent window
-                else:
-                    frames.append(_composite_onto_bg(img, background_rgb))
-            if frames:
-                result[internal_key] = frames
-        if "idle" not in result or "walk" not in result:
-            return None
-        if "sit" not in result:
-            result["sit"] = list(result["idle"])
-        return result
+        loaded = _load_pet_sprites_cached(pet_id, scale, tuple(background_rgb), max_display_size)
+    except FileNotFoundError:
+        # No such pet, or idle/walk frames missing (e.g. assets mid-copy): rescan next time
+        _list_action_frames.cache_clear()
+        return None
     except Exception as e:
         print(f"Error loading pet sprites for {pet_id}: {e}")
         return None
-
-
-def pet_display_size(scale: float = 2.5, pet_id: Optional[str] = None) -> Tuple[int, int]:
+    return {k: list(v) for k, v in loaded.items()}
+
+
+def _frame_executor() -> ThreadPoolExecutor:
+    """Shared pool for frame decoding; Pillow releases the GIL while decoding and resizing."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=FRAME_LOAD_WORKERS, thread_name_prefix="pet-frames")
+        atexit.register(_executor.shutdown, wait=False)
+    return _executor
+
+
+def _load_frame(
+    path: Path,
+    scale: float,
+    background_rgb: Tuple[int, int, int],
+    max_display_size: int,
+) -> Image.Image:
+    """Decode, scale and cap, then (off macOS) composite one frame. Safe to run on any thread."""
+    img = Image.open(path)
+    # Off macOS, opaque sources skip the RGBA convert and the colour-key composite altogether
+    opaque = "A" not in img.getbands() and "transparency" not in img.info
+    img = img.convert("RGB" if opaque and sys.platform != "darwin" else "RGBA")
+    w, h = img.size
+    # One resize from the source (large assets used to be enlarged, then shrunk back)
+    new_size = _final_size(w, h, scale, max_display_size)
+    if new_size != (w, h):
+        img = _resize_frame(img, new_size)
+    # On macOS, keep RGBA for transparency with transparent window
+    # On Windows, composite onto color key for color-key transparency
+    if sys.platform == "darwin" or opaque:
+        return img  # Keep RGBA for macOS transparent window; opaque frames have nothing to key out
+    return _composite_onto_bg(img, background_rgb)
+
+
+@lru_cache(maxsize=8)
+def _load_pet_sprites_cached(
+    pet_id: str,
+    scale: float,
+    background_rgb: Tuple[int, int, int],
+    max_display_size: int,
+) -> Dict[str, Tuple[Image.Image, ...]]:
+    """
+    load_pet_sprites with defaults resolved; frame lists are tuples so the cached entry can't be changed.
+    Only successful loads are cached: raises FileNotFoundError if the pet or its idle/walk frames are
+    missing, and lets decode errors propagate.
+    """
+    result: Dict[str, Tuple[Image.Image, ...]] = {}
+    for action_name, paths in _list_action_frames(pet_id):
+        internal_key = ACTION_MAP.get(action_name, action_name.lower())
+        frames = tuple(_frame_executor().map(
+            partial(_load_frame, scale=scale, background_rgb=background_rgb, max_display_size=max_display_size),
+            paths,
+        ))
+        if frames:
+            result[internal_key] = frames
+    if "idle" not in result or "walk" not in result:
+        raise FileNotFoundError(f"no idle/walk frames for pet {pet_id!r}")
+    if "sit" not in result:
+        result["sit"] = result["idle"]
+    return result
+
+
+def clear_sprite_cache() -> None:
+    """Forget cached pet frames and frame listings (e.g. after assets change on disk)."""
+    _load_pet_sprites_cached.cache_clear()
+    _list_action_frames.cache_clear()
+
+
+def pet_display_size(
+    scale: float = 2.5,
+    pet_id: Optional[str] = None,
+    max_display_size: int = MAX_PET_DISPLAY,
+) -> Tuple[int, int]:
     """
     Return (width, height) in pixels for displayed pet frames.
     Uses first frame of first available action; if pet not loaded, returns (int(24*scale), int(24*scale)).
+    Only the PNG header is read: the size is worked out the way load_pet_sprites scales and caps it.
     """
-    loaded = load_pet_sprites(pet_id=pet_id, scale=scale, background_rgb=PET_TRANSPARENT_KEY_RGB)
-    if loaded:
-        for frames in loaded.values():
-            if frames:
-                return frames[0].size
+    if pet_id is None:
+        pets = list_pets()
+        pet_id = ("person" if "person" in pets else pets[0]) if pets else None
+    if pet_id is not None:
+        try:
+            for _, paths in _list_action_frames(pet_id)[:1]:
+                with Image.open(paths[0]) as img:
+                    return _final_size(img.width, img.height, scale, max_display_size)
+        except OSError:
+            pass
     return (int(24 * scale), int(24 * scale))
 
 